@@ -3,26 +3,40 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import DATA_SCHEDULER, DOMAIN
 from .coordinator import VisionAirCoordinator
+from .scheduler import VisionAirScheduler
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.FAN, Platform.NUMBER, Platform.SENSOR, Platform.SWITCH]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the VisionAir integration."""
+    hass.data[DATA_SCHEDULER] = VisionAirScheduler()
+    await async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up VisionAir from a config entry."""
     address = entry.data[CONF_ADDRESS]
-    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
 
-    coordinator = VisionAirCoordinator(hass, address, update_interval)
+    coordinator = VisionAirCoordinator(
+        hass, address, entry.options, hass.data[DATA_SCHEDULER]
+    )
+    entry.async_on_unload(coordinator.async_track_advertisements())
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -38,14 +52,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     coordinator: VisionAirCoordinator = hass.data[DOMAIN][entry.entry_id]
-    new_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator.update_interval = timedelta(seconds=new_interval)
-    _LOGGER.debug("Update interval changed to %s seconds", new_interval)
+    connection = (coordinator.listen, coordinator.keep_alive)
+    coordinator.apply_options(entry.options)
+    _LOGGER.debug("Update interval changed to %s seconds", coordinator.base_interval)
+    if (coordinator.listen, coordinator.keep_alive) != connection:
+        # A live connection was set up for the old options
+        await coordinator.async_reconnect()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: VisionAirCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
@@ -16,7 +16,25 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFl
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import callback
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_KEEP_ALIVE,
+    CONF_LISTEN,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_STATE_REFRESH_INTERVAL,
+    CONF_STATUS_MAX_AGE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_LISTEN,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STATE_REFRESH_INTERVAL,
+    DEFAULT_STATUS_MAX_AGE,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -121,6 +139,25 @@ class VisionAirOptionsFlow(OptionsFlow):
         current_interval = self.config_entry.options.get(
             CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
         )
+        current_adaptive = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_min_interval = self.config_entry.options.get(
+            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        )
+        current_max_interval = self.config_entry.options.get(
+            CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        )
+        current_keep_alive = self.config_entry.options.get(
+            CONF_KEEP_ALIVE, DEFAULT_KEEP_ALIVE
+        )
+        current_listen = self.config_entry.options.get(CONF_LISTEN, DEFAULT_LISTEN)
+        current_status_max_age = self.config_entry.options.get(
+            CONF_STATUS_MAX_AGE, DEFAULT_STATUS_MAX_AGE
+        )
+        current_state_refresh = self.config_entry.options.get(
+            CONF_STATE_REFRESH_INTERVAL, DEFAULT_STATE_REFRESH_INTERVAL
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -138,6 +175,70 @@ class VisionAirOptionsFlow(OptionsFlow):
                             900: "15 minutes",
                         }
                     ),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=current_adaptive,
+                    ): bool,
+                    vol.Required(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=current_min_interval,
+                    ): vol.In(
+                        {
+                            30: "30 seconds",
+                            60: "1 minute (default)",
+                            120: "2 minutes",
+                            300: "5 minutes",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_MAX_UPDATE_INTERVAL,
+                        default=current_max_interval,
+                    ): vol.In(
+                        {
+                            300: "5 minutes",
+                            900: "15 minutes",
+                            1800: "30 minutes (default)",
+                            3600: "1 hour",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_KEEP_ALIVE,
+                        default=current_keep_alive,
+                    ): vol.In(
+                        {
+                            0: "Disconnect after each update (default)",
+                            30: "30 seconds",
+                            60: "1 minute",
+                            120: "2 minutes",
+                            300: "5 minutes",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_LISTEN,
+                        default=current_listen,
+                    ): bool,
+                    vol.Required(
+                        CONF_STATUS_MAX_AGE,
+                        default=current_status_max_age,
+                    ): vol.In(
+                        {
+                            0: "Always send commands (default)",
+                            60: "1 minute",
+                            300: "5 minutes",
+                            900: "15 minutes",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_STATE_REFRESH_INTERVAL,
+                        default=current_state_refresh,
+                    ): vol.In(
+                        {
+                            0: "Every update (default)",
+                            900: "15 minutes",
+                            1800: "30 minutes",
+                            3600: "1 hour",
+                        }
+                    ),
                 }
             ),
         )
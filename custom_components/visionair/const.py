@@ -2,13 +2,56 @@
 
 DOMAIN = "visionair"
 
+# hass.data key of the scheduler shared by all config entries
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
 # Configuration
 CONF_DEVICE_ADDRESS = "device_address"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_KEEP_ALIVE = "keep_alive"
+CONF_LISTEN = "listen"
+CONF_STATUS_MAX_AGE = "status_max_age"
+CONF_STATE_REFRESH_INTERVAL = "state_refresh_interval"
 
 # Default update interval in seconds (5 minutes to avoid blocking VMI app connections)
 DEFAULT_UPDATE_INTERVAL = 300
 
+# Adaptive polling bounds in seconds (polls faster after commands and during
+# boost, backs off while nothing changes or the device is unreachable)
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_UPDATE_INTERVAL = 60
+DEFAULT_MAX_UPDATE_INTERVAL = 1800
+
+# Default connection keep-alive in seconds (0 = disconnect after every poll/command)
+DEFAULT_KEEP_ALIVE = 0
+
+# Keep the connection open to receive state changes as the device sends them
+# (blocks the VMI app while enabled)
+DEFAULT_LISTEN = False
+
+# Default age in seconds up to which polled state is trusted to skip commands
+# that would not change anything (0 = always send). Opt-in: changes made with
+# the RF remote or the VMI app are only seen by the next poll, or right away
+# with the listen option
+DEFAULT_STATUS_MAX_AGE = 0
+
+# Default interval in seconds between full device state refreshes; polls in
+# between only fetch sensor readings (0 = refresh state on every poll)
+DEFAULT_STATE_REFRESH_INTERVAL = 0
+
+# Connections open at once per Bluetooth adapter or proxy (ESPHome proxies
+# have 3 slots by default; leave room for other integrations)
+MAX_CONNECTIONS_PER_SOURCE = 2
+
+# Minimum seconds between poll starts on the same adapter or proxy
+POLL_SPACING = 5.0
+
+# Seconds a poll or command waits for a connection slot before giving up
+SLOT_WAIT_TIMEOUT = 120.0
+
 # Fan speed modes
 SPEED_LOW = "low"
 SPEED_MEDIUM = "medium"
@@ -17,3 +60,8 @@ SPEED_HIGH = "high"
 # Preset modes
 PRESET_NONE = "none"
 PRESET_BOOST = "boost"
+
+# Services
+SERVICE_APPLY_SETTINGS = "apply_settings"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_FORCE = "force"
@@ -2,62 +2,723 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import TYPE_CHECKING
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient
 from bleak.exc import BleakError
-from .visionair_ble import VisionAirClient, DeviceStatus
+from .visionair_ble import (
+    APPLY_SETTINGS,
+    DEVICE_STATUS_SENSORS,
+    ClientStats,
+    DeviceStatus,
+    VisionAirClient,
+    parse_schedule_data,
+    parse_sensors,
+    parse_status,
+)
+from .visionair_ble.protocol import PacketType
 
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_KEEP_ALIVE,
+    CONF_LISTEN,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_STATE_REFRESH_INTERVAL,
+    CONF_STATUS_MAX_AGE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_LISTEN,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_STATE_REFRESH_INTERVAL,
+    DEFAULT_STATUS_MAX_AGE,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    SLOT_WAIT_TIMEOUT,
+)
+from .derived import AirVolumeMeter
 
 if TYPE_CHECKING:
     from bleak.backends.device import BLEDevice
 
+    from .scheduler import VisionAirScheduler
+
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor readings that DEVICE_STATE doesn't carry; command responses keep
+# the last polled values for these
+_READING_FIELDS = (
+    "temp_remote",
+    "temp_probe1",
+    "temp_probe2",
+    "humidity_remote",
+    "humidity_probe1",
+)
+
+# Deadband and min_interval of readings filtered before publishing, from
+# their sensor metadata; other status fields are compared as they are
+_FILTERS: dict[str, tuple[float, float | None]] = {
+    desc.key: (desc.deadband, desc.min_interval)
+    for desc in DEVICE_STATUS_SENSORS
+    if desc.deadband is not None
+}
+_UNFILTERED = tuple(f.name for f in fields(DeviceStatus) if f.name not in _FILTERS)
+
+_Command = Callable[[VisionAirClient], Awaitable[DeviceStatus]]
+
+# Connection attempts per poll or command. Retries back off exponentially
+# with jitter; a proxy without free connection slots gets a longer pause to
+# let other connections finish.
+_CONNECT_ATTEMPTS = 3
+_CONNECT_BACKOFF = 1.0
+_CONNECT_BACKOFF_MAX = 8.0
+_SLOTS_BACKOFF = 10.0
+
+
+# Number of recent polls the success rate is computed over
+_RECENT_POLLS = 20
+
+
+@dataclass
+class CoordinatorStats:
+    """Poll, command and connection counters of a coordinator.
+
+    ``timings`` holds the duration in seconds of the most recent wait for a
+    connection slot ("slot_wait"), connection setup including retries
+    ("connect"), device fetch within a poll ("poll") and command ("command").
+    """
+
+    polls: int = 0
+    poll_failures: int = 0
+    polls_skipped: int = 0
+    commands: int = 0
+    command_failures: int = 0
+    connects: int = 0
+    connect_failures: int = 0
+    connect_retries: int = 0
+    last_poll_duration: float | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    recent_polls: deque[bool] = field(
+        default_factory=lambda: deque(maxlen=_RECENT_POLLS)
+    )
+
+    @property
+    def poll_success_rate(self) -> float | None:
+        """Percentage of the recent polls that succeeded."""
+        if not self.recent_polls:
+            return None
+        return round(100 * sum(self.recent_polls) / len(self.recent_polls), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as JSON-serializable data."""
+        return {
+            "polls": self.polls,
+            "poll_failures": self.poll_failures,
+            "polls_skipped": self.polls_skipped,
+            "poll_success_rate": self.poll_success_rate,
+            "last_poll_duration": self.last_poll_duration,
+            "commands": self.commands,
+            "command_failures": self.command_failures,
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "connect_retries": self.connect_retries,
+            "timings": dict(self.timings),
+        }
+
+
+def _is_out_of_slots(err: Exception) -> bool:
+    """Return whether a connect failed because the proxy has no free slots."""
+    return (
+        type(err).__name__ == "BleakOutOfConnectionSlotsError"
+        or "connection slot" in str(err).lower()
+    )
+
 
 class VisionAirCoordinator(DataUpdateCoordinator[DeviceStatus]):
-    """Coordinator for VisionAir device data."""
+    """Coordinator for VisionAir device data.
+
+    By default every poll and command opens its own BLE connection. With
+    ``keep_alive`` set, the connection is kept open and reused until it has
+    been idle for that many seconds, then released so the VMI app can
+    connect again. With ``listen`` set, the connection stays open and every
+    DEVICE_STATE, SCHEDULE or PROBE_SENSORS packet the device sends on its
+    own (e.g. after a change from the RF remote) is applied right away;
+    each one postpones the next poll, so polling only fills gaps.
+
+    Commands are queued per setting and sent in one connection. A newer
+    value for a setting replaces one that hasn't been sent yet, and a poll
+    that comes due while commands are queued uses their response instead
+    of fetching again.
+
+    Settings that data received within ``status_max_age`` seconds already
+    shows are not sent at all, unless forced.
+
+    With ``state_refresh_interval`` set, polls in between only fetch the
+    sensor readings and keep the last known settings; the settings are read
+    again once that interval has passed. Command responses count as a
+    settings read.
+
+    With adaptive polling, the interval between polls moves between the
+    configured minimum and maximum: it drops to the minimum after a command
+    and while boost is running, doubles while nothing changes or while the
+    device keeps failing, and returns to the base interval on any change.
+
+    Advertisements from the device are tracked passively. While Home
+    Assistant's Bluetooth manager considers the device unavailable, polls
+    fail right away instead of waiting for a connect timeout, and the next
+    advertisement triggers the skipped poll.
+
+    Connection slots are shared with the other config entries through the
+    domain's VisionAirScheduler, which caps connections per adapter or
+    proxy, spaces out polls and lets commands go first.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         address: str,
-        update_interval: int = DEFAULT_UPDATE_INTERVAL,
+        options: Mapping[str, Any],
+        scheduler: VisionAirScheduler,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"VisionAir {address}",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
         )
         self.address = address
+        self.scheduler = scheduler
+        self.keep_alive = DEFAULT_KEEP_ALIVE
+        self.listen = DEFAULT_LISTEN
+        self.status_max_age = DEFAULT_STATUS_MAX_AGE
+        self.state_refresh_interval = DEFAULT_STATE_REFRESH_INTERVAL
+        self.base_interval = DEFAULT_UPDATE_INTERVAL
+        self.adaptive_polling = DEFAULT_ADAPTIVE_POLLING
+        self.min_update_interval = DEFAULT_MIN_UPDATE_INTERVAL
+        self.max_update_interval = DEFAULT_MAX_UPDATE_INTERVAL
+        self._failures = 0
+        self._status_time: float | None = None
+        self._ble_client: BleakClient | None = None
+        self._release_slot: Callable[[], None] | None = None
+        self._slot_source: str | None = None
         self._client: VisionAirClient | None = None
+        self._session_lock = asyncio.Lock()
+        self._cancel_idle_disconnect: CALLBACK_TYPE | None = None
+        self._pending: dict[str, tuple[_Command, list[asyncio.Future[None]]]] = {}
+        self._drain_task: asyncio.Task[None] | None = None
+        self.stats = CoordinatorStats()
+        self.client_stats = ClientStats()
+        self.rssi: int | None = None
+        self.last_seen: datetime | None = None
+        # Set when the Bluetooth manager marks the device unavailable
+        self._away = False
+        self._poll_deferred = False
+        # Whether the last poll read the device state or reused the settings
+        self._state_polled = True
+        # DeviceStatus fields that changed in the update being published;
+        # None means entities can't rely on it and must all write state
+        self.changed_fields: frozenset[str] | None = None
+        self._published: DeviceStatus | None = None
+        self._published_success = True
+        # Last published value and time of each filtered reading
+        self._published_readings: dict[str, tuple[Any, float]] = {}
+        self.air_volume = AirVolumeMeter()
+        self.apply_options(options)
 
-    async def _async_update_data(self) -> DeviceStatus:
-        """Fetch data from the device.
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply config entry options."""
+        self.keep_alive = options.get(CONF_KEEP_ALIVE, DEFAULT_KEEP_ALIVE)
+        self.listen = options.get(CONF_LISTEN, DEFAULT_LISTEN)
+        self.status_max_age = options.get(CONF_STATUS_MAX_AGE, DEFAULT_STATUS_MAX_AGE)
+        if self._client is not None:
+            self._client.status_max_age = self.status_max_age
+        self.state_refresh_interval = options.get(
+            CONF_STATE_REFRESH_INTERVAL, DEFAULT_STATE_REFRESH_INTERVAL
+        )
+        self.base_interval = options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        self.adaptive_polling = options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self.min_update_interval = min(
+            options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL),
+            self.base_interval,
+        )
+        self.max_update_interval = max(
+            options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL),
+            self.base_interval,
+        )
+        self.update_interval = timedelta(seconds=self.base_interval)
 
-        Uses get_fresh_status() which sends three BLE requests to collect
-        fresh temperature and humidity readings for all probes and the remote.
+    def _adapt_interval(self, status: DeviceStatus | None) -> None:
+        """Choose the next poll interval after a poll.
+
+        Args:
+            status: The polled status, or None if the poll failed
         """
-        ble_device = bluetooth.async_ble_device_from_address(
+        if not self.adaptive_polling:
+            return
+
+        current = self.update_interval.total_seconds() if self.update_interval else self.base_interval
+        if status is None:
+            self._failures += 1
+            seconds = self.base_interval * 2 ** self._failures
+        else:
+            self._failures = 0
+            if status.boost_active:
+                # Boost counts down from 30 minutes; follow it closely
+                seconds = self.min_update_interval
+            elif status != self.data:
+                seconds = self.base_interval
+            elif status.holiday_days:
+                # Holiday counts down in days; don't back off past the base
+                seconds = self.base_interval
+            elif not self._state_polled:
+                # The settings were carried over from the last state refresh,
+                # so a boost started from the remote wouldn't show yet
+                seconds = current
+            else:
+                seconds = current * 2
+
+        seconds = max(self.min_update_interval, min(seconds, self.max_update_interval))
+        if seconds != current:
+            _LOGGER.debug("Next poll of %s in %s seconds", self.address, seconds)
+        self.update_interval = timedelta(seconds=seconds)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, recording which status fields changed.
+
+        A reading with a deadband only counts as changed once it has moved
+        past the deadband from its last published value, or once that value
+        is min_interval seconds old.
+        """
+        previous, data = self._published, self.data
+        now = time.monotonic()
+        if (
+            previous is None
+            or data is None
+            or self.last_update_success != self._published_success
+        ):
+            self.changed_fields = None
+        else:
+            changed = {
+                name
+                for name in _UNFILTERED
+                if getattr(previous, name) != getattr(data, name)
+            }
+            for name, (deadband, min_interval) in _FILTERS.items():
+                value = getattr(data, name)
+                last, published_at = self._published_readings[name]
+                if value == last:
+                    continue
+                if (
+                    value is None
+                    or last is None
+                    or abs(value - last) > deadband
+                    or (min_interval is not None and now - published_at >= min_interval)
+                ):
+                    changed.add(name)
+            self.changed_fields = frozenset(changed)
+
+        if not self.last_update_success:
+            self.air_volume.pause()
+        elif data is not None and data is not previous:
+            # A successful poll follows the last one within the slowest interval
+            self.air_volume.add(data.airflow, now, 2 * self.max_update_interval)
+        if data is not None:
+            for name in _FILTERS:
+                if self.changed_fields is None or name in self.changed_fields:
+                    self._published_readings[name] = (getattr(data, name), now)
+        self._published = data
+        self._published_success = self.last_update_success
+        super().async_update_listeners()
+
+    @callback
+    def async_track_advertisements(self) -> CALLBACK_TYPE:
+        """Start tracking advertisements; returns a callback to stop."""
+        cancel_advertisements = bluetooth.async_register_callback(
+            self.hass,
+            self._async_on_advertisement,
+            bluetooth.BluetoothCallbackMatcher(address=self.address, connectable=False),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+        cancel_unavailable = bluetooth.async_track_unavailable(
+            self.hass, self._async_on_unavailable, self.address, connectable=False
+        )
+
+        @callback
+        def _async_cancel() -> None:
+            cancel_advertisements()
+            cancel_unavailable()
+
+        return _async_cancel
+
+    @callback
+    def _async_on_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Record an advertisement and run a poll skipped while out of range.
+
+        The callback only runs when the advertisement changes, so it can't
+        tell how long ago the device was last heard; the unavailable
+        callback and _async_refresh_presence() cover that.
+        """
+        self._record_advertisement(service_info)
+        if not self._away:
+            return
+        self._away = False
+        if self._poll_deferred:
+            _LOGGER.debug("%s is advertising again, polling now", self.address)
+            self._poll_deferred = False
+            self.hass.async_create_task(self.async_request_refresh())
+        else:
+            self.async_update_listeners()
+
+    @callback
+    def _async_on_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Mark the device out of range once it stopped advertising."""
+        _LOGGER.debug("%s stopped advertising, skipping polls", self.address)
+        self._away = True
+
+    @callback
+    def _async_refresh_presence(self) -> None:
+        """Update presence, RSSI and last seen from the last advertisement."""
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.address, connectable=False
+        )
+        if service_info is None:
+            return
+        self._record_advertisement(service_info)
+        # The manager drops the history of unavailable devices
+        self._away = False
+
+    def _record_advertisement(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Store the signal strength and time of an advertisement."""
+        now = time.monotonic()
+        # Replayed history can be older than now
+        age = max(now - service_info.time, 0)
+        self.last_seen = dt_util.utcnow() - timedelta(seconds=age)
+        self.rssi = service_info.rssi
+
+    @property
+    def device_present(self) -> bool:
+        """Return whether the device is advertising or connected.
+
+        The device stops advertising while a client is connected, and is
+        assumed present until the Bluetooth manager marks it unavailable.
+        """
+        if self._ble_client is not None and self._ble_client.is_connected:
+            return True
+        return not self._away
+
+    @asynccontextmanager
+    async def _async_session(
+        self, not_found: type[HomeAssistantError], *, command: bool = False
+    ) -> AsyncIterator[VisionAirClient]:
+        """Provide a connected VisionAirClient for one poll or command.
+
+        Operations are serialized: the device only accepts one client and
+        one request at a time. When listening or keep-alive is enabled the
+        connection outlives the operation and is reused by the next one;
+        otherwise, or after any error, it is closed right away.
+
+        Args:
+            not_found: Exception type raised if the device is not reachable
+            command: Whether the session sends commands rather than polls
+        """
+        async with self._session_lock:
+            self._cancel_idle_timer()
+            try:
+                visionair = await self._async_connect(not_found, command)
+                yield visionair
+            except BaseException:
+                await self._async_disconnect()
+                raise
+            if self.listen:
+                # Stay connected to receive updates the device pushes
+                pass
+            elif self.keep_alive > 0:
+                self._cancel_idle_disconnect = async_call_later(
+                    self.hass, self.keep_alive, self._async_idle_disconnect
+                )
+            else:
+                await self._async_disconnect()
+
+        if (
+            self._ble_client is not None
+            and self._slot_source is not None
+            and self.scheduler.has_waiters(self._slot_source)
+        ):
+            # Another entry asked for the slot while this session was busy
+            self._release_idle()
+
+    async def _async_connect(
+        self, not_found: type[HomeAssistantError], command: bool
+    ) -> VisionAirClient:
+        """Return the live session, connecting first if needed."""
+        if (
+            self._client is not None
+            and self._ble_client is not None
+            and self._ble_client.is_connected
+        ):
+            return self._client
+        if self._release_slot is not None:
+            # The last connection dropped without a disconnect callback
+            self._ble_client = None
+            self._client = None
+            self._release_connection_slot()
+
+        service_info = bluetooth.async_last_service_info(
             self.hass, self.address, connectable=True
         )
-        if not ble_device:
-            raise UpdateFailed(f"Device {self.address} not found")
+        source = service_info.source if service_info else "unknown"
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(SLOT_WAIT_TIMEOUT):
+                release = await self.scheduler.async_acquire(
+                    source, command=command, release_idle=self._release_idle
+                )
+        except TimeoutError as err:
+            raise not_found(
+                f"No free Bluetooth connection slot on {source} for {self.address}"
+            ) from err
+        self.stats.timings["slot_wait"] = time.monotonic() - start
+        start = time.monotonic()
+        try:
+            client = await self._async_establish(not_found)
+        except BaseException:
+            release()
+            raise
+        self.stats.timings["connect"] = time.monotonic() - start
+        self._release_slot = release
+        self._slot_source = source
+        self._ble_client = client
+        self._client = VisionAirClient(
+            client, status_max_age=self.status_max_age, stats=self.client_stats
+        )
+        if self.keep_alive > 0 or self.listen:
+            # Subscribe once for the whole session instead of per request
+            await self._client.start_notifications()
+        if self.listen:
+            self._client.add_listener(self._async_on_push)
+        _LOGGER.debug("Connected to %s", self.address)
+        return self._client
+
+    async def _async_establish(
+        self, not_found: type[HomeAssistantError]
+    ) -> BleakClient:
+        """Open a BLE connection, retrying transient failures.
+
+        The device is looked up again before every attempt, so a retry can
+        go through another adapter or proxy. The last error is raised once
+        all attempts have failed.
+        """
+        attempt = 1
+        while True:
+            ble_device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
+            )
+            if not ble_device:
+                raise not_found(f"Device {self.address} not found")
+
+            client = BleakClient(ble_device, disconnected_callback=self._on_disconnect)
+            try:
+                await client.connect()
+            except (BleakError, TimeoutError) as err:
+                self.stats.connect_failures += 1
+                if attempt >= _CONNECT_ATTEMPTS:
+                    raise
+                self.stats.connect_retries += 1
+                if _is_out_of_slots(err):
+                    delay = _SLOTS_BACKOFF
+                else:
+                    delay = min(_CONNECT_BACKOFF * 2 ** (attempt - 1), _CONNECT_BACKOFF_MAX)
+                delay = random.uniform(delay / 2, delay)
+                _LOGGER.debug(
+                    "Connecting to %s failed (attempt %s/%s), retrying in %.1fs: %s",
+                    self.address,
+                    attempt,
+                    _CONNECT_ATTEMPTS,
+                    delay,
+                    err,
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                self.stats.connects += 1
+                return client
+
+    async def _async_disconnect(self) -> None:
+        """Close the current connection, if any."""
+        client = self._ble_client
+        self._ble_client = None
+        self._client = None
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except BleakError as err:
+            _LOGGER.debug("Error disconnecting from %s: %s", self.address, err)
+        finally:
+            self._release_connection_slot()
+
+    def _release_connection_slot(self) -> None:
+        """Give the connection slot back to the scheduler."""
+        if self._release_slot is not None:
+            self._release_slot()
+            self._release_slot = None
+
+    @callback
+    def _release_idle(self) -> bool:
+        """Close a kept-alive connection early because another entry needs the slot.
+
+        Returns whether the connection is being closed; a busy one is not.
+        """
+        if self._cancel_idle_disconnect is not None or (
+            self.listen and not self._session_lock.locked()
+        ):
+            self._cancel_idle_timer()
+            self.hass.async_create_task(self._async_idle_disconnect(dt_util.utcnow()))
+            return True
+        return False
+
+    async def _async_idle_disconnect(self, _now: datetime) -> None:
+        """Release the connection once the keep-alive window has passed."""
+        self._cancel_idle_disconnect = None
+        async with self._session_lock:
+            if self._cancel_idle_disconnect is None:
+                _LOGGER.debug("Closing idle connection to %s", self.address)
+                await self._async_disconnect()
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending idle disconnect."""
+        if self._cancel_idle_disconnect is not None:
+            self._cancel_idle_disconnect()
+            self._cancel_idle_disconnect = None
+
+    def _on_disconnect(self, client: BleakClient) -> None:
+        """Forget the session when the device drops the connection."""
+        if client is self._ble_client:
+            _LOGGER.debug("Disconnected from %s", self.address)
+            self._ble_client = None
+            self._client = None
+            self._release_connection_slot()
+
+    async def async_reconnect(self) -> None:
+        """Close the connection so the next session uses the current options.
+
+        Whether notifications stay subscribed and pushed packets are
+        listened to is decided when connecting. When listening, connects
+        again right away instead of waiting for the next poll.
+        """
+        self._cancel_idle_timer()
+        async with self._session_lock:
+            await self._async_disconnect()
+        if self.listen:
+            await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the idle timer and close the connection."""
+        await super().async_shutdown()
+        self._cancel_idle_timer()
+        async with self._session_lock:
+            await self._async_disconnect()
+
+    async def _async_update_data(self) -> DeviceStatus:
+        """Fetch data from the device and adapt the poll interval."""
+        if self._drain_task is not None and self.data is not None:
+            # Fold this refresh into the response of the queued commands
+            previous = self.data
+            await asyncio.shield(self._drain_task)
+            if self.data is not previous:
+                return self.data
+            # No command got a status back; poll as usual
+
+        try:
+            status = await self._async_fetch_status()
+        except UpdateFailed:
+            self._adapt_interval(None)
+            raise
+        self._adapt_interval(status)
+        return status
 
+    async def _async_fetch_status(self) -> DeviceStatus:
+        """Fetch data from the device.
+
+        Uses get_fresh_status() to collect fresh temperature and humidity
+        readings for all probes and the remote. The client picks one FULL_DATA
+        request on direct adapters and three separate requests via proxies.
+        Until the state refresh interval has passed, the last known settings
+        are passed as base so the device state isn't requested again.
+        """
+        base = None
+        if (
+            self.state_refresh_interval
+            and self.data is not None
+            and self._status_time is not None
+            and time.monotonic() - self._status_time < self.state_refresh_interval
+        ):
+            base = self.data
+        self._state_polled = base is None
+
+        self._async_refresh_presence()
+        if not self.device_present:
+            self._poll_deferred = True
+            self.stats.polls_skipped += 1
+            raise UpdateFailed(
+                f"Device {self.address} has not advertised since {self.last_seen}"
+            )
+
+        self.stats.polls += 1
+        start = time.monotonic()
+        try:
+            status = await self._async_poll(base)
+        except UpdateFailed:
+            self.stats.poll_failures += 1
+            self.stats.recent_polls.append(False)
+            raise
+        finally:
+            self.stats.last_poll_duration = time.monotonic() - start
+        self.stats.recent_polls.append(True)
+        return status
+
+    async def _async_poll(self, base: DeviceStatus | None) -> DeviceStatus:
+        """Connect and fetch the status, mapping errors to UpdateFailed."""
         try:
-            async with BleakClient(ble_device) as client:
-                visionair = VisionAirClient(client)
-                status = await visionair.get_fresh_status()
+            async with self._async_session(UpdateFailed) as visionair:
+                start = time.monotonic()
+                status = await visionair.get_fresh_status(base=base)
+                self.stats.timings["poll"] = time.monotonic() - start
+                if visionair.last_status is status:
+                    # The device state was read, also when FULL_DATA carried
+                    # it along with a base
+                    self._status_time = time.monotonic()
+                    self._state_polled = True
 
                 _LOGGER.debug(
                     "VisionAir status update - temp_remote: %s, temp_probe1: %s, "
@@ -75,54 +736,222 @@ class VisionAirCoordinator(DataUpdateCoordinator[DeviceStatus]):
         except TimeoutError as err:
             raise UpdateFailed(f"Timeout communicating with device: {err}") from err
 
-    async def _async_send_command(self, action: str, command) -> None:
-        """Send a command to the device and update coordinator data."""
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, self.address, connectable=True
-        )
-        if not ble_device:
-            raise HomeAssistantError(f"Device {self.address} not found")
+    async def _async_send_command(self, action: str, command: _Command) -> None:
+        """Queue a command and wait until it (or a newer one) has been sent.
+
+        The action doubles as the coalescing key: a queued command for the
+        same setting is replaced, and its caller waits for the replacement.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        _, waiters = self._pending.pop(action, (None, []))
+        waiters.append(future)
+        self._pending[action] = (command, waiters)
+
+        if self._drain_task is None:
+            self._drain_task = self.hass.async_create_background_task(
+                self._async_drain(), f"{self.name} commands"
+            )
+        await future
 
+    async def _async_drain(self) -> None:
+        """Send queued commands over one connection until the queue is empty.
+
+        If the session fails or is cancelled, the command being sent and all
+        queued ones fail with it; they are not retried.
+        """
+        action: str | None = None
+        waiters: list[asyncio.Future[None]] = []
+        failure: Exception | None = None
         try:
-            async with BleakClient(ble_device) as client:
-                visionair = VisionAirClient(client)
-                new_status = await command(visionair)
-                self.async_set_updated_data(new_status)
-        except (BleakError, TimeoutError) as err:
-            raise HomeAssistantError(f"Error {action}: {err}") from err
-
-    async def async_set_airflow_mode(self, mode: str) -> None:
+            async with self._async_session(HomeAssistantError, command=True) as visionair:
+                while self._pending:
+                    action = next(iter(self._pending))
+                    command, waiters = self._pending.pop(action)
+                    self.stats.commands += 1
+                    start = time.monotonic()
+                    try:
+                        new_status = await command(visionair)
+                    except (BleakError, TimeoutError) as err:
+                        self.stats.command_failures += 1
+                        self._fail(waiters, HomeAssistantError(f"Error {action}: {err}"))
+                        continue
+                    except Exception as err:
+                        # Invalid values etc. are raised to the caller as is
+                        self.stats.command_failures += 1
+                        self._fail(waiters, err)
+                        continue
+                    self.stats.timings["command"] = time.monotonic() - start
+                    self._status_time = time.monotonic()
+                    if self.adaptive_polling:
+                        # Confirm the result of the command soon
+                        self.update_interval = timedelta(
+                            seconds=self.min_update_interval
+                        )
+                    self.async_set_updated_data(self._keep_readings(new_status))
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        except asyncio.CancelledError:
+            failure = HomeAssistantError("Sending commands was cancelled")
+            raise
+        except Exception as err:  # noqa: BLE001
+            if not isinstance(err, (BleakError, TimeoutError, HomeAssistantError)):
+                _LOGGER.exception("Unexpected error sending commands to %s", self.address)
+            failure = err
+        finally:
+            self._drain_task = None
+            if failure is not None:
+                if action is not None:
+                    # The command in progress when the session failed
+                    self._fail(waiters, HomeAssistantError(f"Error {action}: {failure}"))
+                for queued_action, (_, queued) in list(self._pending.items()):
+                    self._fail(queued, HomeAssistantError(f"Error {queued_action}: {failure}"))
+                self._pending.clear()
+            elif self._pending:
+                # Commands queued while the connection was being closed
+                self._drain_task = self.hass.async_create_background_task(
+                    self._async_drain(), f"{self.name} commands"
+                )
+
+    @staticmethod
+    def _fail(waiters: list[asyncio.Future[None]], err: Exception) -> None:
+        """Fail every caller waiting on a command."""
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(err)
+
+    @callback
+    def _async_on_push(self, data: bytes) -> None:
+        """Apply a packet the device sent on its own while listening."""
+        if self._session_lock.locked() or self.data is None:
+            # Responses to our own requests are handled by the session
+            return
+
+        packet_type = data[2]
+        if packet_type == PacketType.DEVICE_STATE:
+            status = parse_status(data)
+            if status is None:
+                return
+            self._status_time = time.monotonic()
+            new_data = self._keep_readings(status)
+        elif packet_type == PacketType.SCHEDULE:
+            remote_temp, remote_humidity = parse_schedule_data(data)
+            new_data = self.data.merged(
+                temp_remote=remote_temp, humidity_remote=remote_humidity
+            )
+        elif packet_type == PacketType.PROBE_SENSORS:
+            sensors = parse_sensors(data)
+            if sensors is None:
+                return
+            new_data = self.data.merged(
+                temp_probe1=sensors.temp_probe1,
+                temp_probe2=sensors.temp_probe2,
+                humidity_probe1=sensors.humidity_probe1,
+            )
+        else:
+            return
+
+        _LOGGER.debug("Received update from %s (packet 0x%02x)", self.address, packet_type)
+        self.async_set_updated_data(new_data)
+
+    def _keep_readings(self, status: DeviceStatus) -> DeviceStatus:
+        """Carry the last polled sensor readings over into a command response."""
+        if self.data is None:
+            return status
+        return status.merged(
+            **{
+                name: getattr(self.data, name)
+                for name in _READING_FIELDS
+                if getattr(status, name) is None
+            },
+        )
+
+    def _is_current(self, key: str, value: Any, force: bool = False) -> bool:
+        """Return True if recent data already shows this setting at value.
+
+        Lets re-asserted settings skip the connection entirely. Only data
+        received within status_max_age seconds counts. While commands are
+        queued or being sent, the data may be overtaken by them, so nothing
+        is skipped and the newest value is queued last.
+        """
+        if force or self._drain_task is not None:
+            return False
+        data = self._recent_data()
+        if data is None:
+            return False
+        field_name, _ = APPLY_SETTINGS[key]
+        return getattr(data, field_name) == value
+
+    def _recent_data(self) -> DeviceStatus | None:
+        """Return the data if it was received within status_max_age seconds."""
+        if self.data is None or self._status_time is None:
+            return None
+        if time.monotonic() - self._status_time > self.status_max_age:
+            return None
+        return self.data
+
+    async def async_set_airflow_mode(self, mode: str, force: bool = False) -> None:
         """Set the airflow mode."""
+        if self._is_current("airflow_mode", mode, force):
+            return
         await self._async_send_command(
-            "setting airflow mode", lambda v: v.set_airflow_mode(mode)
+            "setting airflow mode", lambda v: v.set_airflow_mode(mode, force=force)
         )
 
-    async def async_set_boost(self, enable: bool) -> None:
+    async def async_set_boost(self, enable: bool, force: bool = False) -> None:
         """Enable or disable boost mode."""
+        if self._is_current("boost", enable, force):
+            return
         await self._async_send_command(
-            "setting boost", lambda v: v.set_boost(enable)
+            "setting boost", lambda v: v.set_boost(enable, force=force)
         )
 
-    async def async_set_preheat(self, enabled: bool) -> None:
+    async def async_set_preheat(self, enabled: bool, force: bool = False) -> None:
         """Set preheat on/off."""
+        if self._is_current("preheat", enabled, force):
+            return
         await self._async_send_command(
-            "setting preheat", lambda v: v.set_preheat(enabled)
+            "setting preheat", lambda v: v.set_preheat(enabled, force=force)
         )
 
-    async def async_set_holiday(self, days: int) -> None:
+    async def async_set_holiday(self, days: int, force: bool = False) -> None:
         """Set holiday mode duration (0 to disable)."""
+        if self._is_current("holiday_days", days, force):
+            return
         await self._async_send_command(
-            "setting holiday mode", lambda v: v.set_holiday(days)
+            "setting holiday mode", lambda v: v.set_holiday(days, force=force)
         )
 
-    async def async_set_preheat_temperature(self, temperature: int) -> None:
+    async def async_set_preheat_temperature(
+        self, temperature: int, force: bool = False
+    ) -> None:
         """Set preheat temperature (14-22°C)."""
+        if self._is_current("preheat_temperature", temperature, force):
+            return
         await self._async_send_command(
-            "setting preheat temperature", lambda v: v.set_preheat_temperature(temperature)
+            "setting preheat temperature",
+            lambda v: v.set_preheat_temperature(temperature, force=force),
         )
 
-    async def async_set_summer_limit(self, enabled: bool) -> None:
+    async def async_set_summer_limit(self, enabled: bool, force: bool = False) -> None:
         """Set summer limit."""
+        if self._is_current("summer_limit", enabled, force):
+            return
+        await self._async_send_command(
+            "setting summer limit", lambda v: v.set_summer_limit(enabled, force=force)
+        )
+
+    async def async_apply(self, changes: Mapping[str, Any], force: bool = False) -> None:
+        """Apply several settings at once, sending only those that differ."""
+        changes = {
+            key: value
+            for key, value in changes.items()
+            if not self._is_current(key, value, force)
+        }
+        if not changes:
+            return
         await self._async_send_command(
-            "setting summer limit", lambda v: v.set_summer_limit(enabled)
+            f"applying {', '.join(sorted(changes))}",
+            # Compare against recent data instead of reading the state again
+            lambda v: v.apply(changes, base=self._recent_data(), force=force),
         )
@@ -0,0 +1,91 @@
+"""Values derived from VisionAir readings.
+
+Computed from each new DeviceStatus, so dashboards don't need template or
+statistics sensors for them.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from .visionair_ble import DeviceStatus
+
+# Volumetric heat capacity of air in W·h/(m³·K):
+# 1.2 kg/m³ × 1005 J/(kg·K) / 3600 s/h
+AIR_HEAT_CAPACITY = 0.335
+
+# Smallest room to inlet temperature difference (°C) the efficiency is
+# computed for; the probes report whole degrees, so below this the ratio is
+# mostly rounding
+_MIN_EFFICIENCY_SPREAD = 3
+
+
+def heat_recovery_efficiency(status: DeviceStatus) -> float | None:
+    """Return the temperature efficiency of the supply air in percent.
+
+    How far the outlet air is brought from the inlet temperature towards
+    the room temperature: (outlet - inlet) / (room - inlet).
+    """
+    outlet, inlet, room = status.temp_probe1, status.temp_probe2, status.temp_remote
+    if outlet is None or inlet is None or room is None:
+        return None
+    if abs(room - inlet) < _MIN_EFFICIENCY_SPREAD:
+        return None
+    return (outlet - inlet) / (room - inlet) * 100
+
+
+def thermal_power(status: DeviceStatus) -> float | None:
+    """Return the heat added to the supply air in W (negative when cooled)."""
+    outlet, inlet = status.temp_probe1, status.temp_probe2
+    if outlet is None or inlet is None:
+        return None
+    return AIR_HEAT_CAPACITY * status.airflow * (outlet - inlet)
+
+
+def absolute_humidity(temperature: float | None, humidity: float | None) -> float | None:
+    """Return the water content of air in g/m³.
+
+    Uses the Magnus formula for the saturation vapour pressure.
+
+    Args:
+        temperature: Air temperature in °C
+        humidity: Relative humidity in %
+    """
+    if temperature is None or humidity is None:
+        return None
+    saturation = 6.112 * math.exp(17.67 * temperature / (temperature + 243.5))
+    return saturation * humidity * 2.1674 / (273.15 + temperature)
+
+
+@dataclass(slots=True)
+class AirVolumeMeter:
+    """Running total of the air moved, in m³.
+
+    Each sample adds the previous airflow over the time since that sample,
+    up to max_interval. Time starts at the first sample and again after
+    pause(), so downtime and failed polls are not counted as ventilation.
+    """
+
+    total: float = 0.0
+    _airflow: int | None = None
+    _time: float | None = None
+
+    def add(self, airflow: int, now: float, max_interval: float) -> None:
+        """Record an airflow reading (m³/h) taken at monotonic time now.
+
+        Args:
+            airflow: Airflow in m³/h
+            now: Monotonic time of the reading
+            max_interval: Longest time in seconds one reading is counted for
+        """
+        if self._airflow is not None and self._time is not None:
+            elapsed = min(now - self._time, max_interval)
+            self.total += self._airflow * elapsed / 3600
+        self._airflow = airflow
+        self._time = now
+
+    def pause(self) -> None:
+        """Stop counting until the next reading, e.g. while polls fail."""
+        self._airflow = None
+        self._time = None
@@ -0,0 +1,46 @@
+"""Diagnostics support for VisionAir."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import VisionAirCoordinator
+
+TO_REDACT = {CONF_ADDRESS}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: VisionAirCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "device_present": coordinator.device_present,
+            "rssi": coordinator.rssi,
+            "last_seen": (
+                coordinator.last_seen.isoformat() if coordinator.last_seen else None
+            ),
+            "stats": coordinator.stats.as_dict(),
+        },
+        "client": dataclasses.asdict(coordinator.client_stats),
+        "data": dataclasses.asdict(coordinator.data) if coordinator.data else None,
+    }
@@ -0,0 +1,26 @@
+"""Base entity for VisionAir integration."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import VisionAirCoordinator
+
+
+class VisionAirEntity(CoordinatorEntity[VisionAirCoordinator]):
+    """Entity showing DeviceStatus fields.
+
+    Coordinator updates that change none of the fields in _status_fields
+    don't write state, so stable readings don't produce state changes.
+    """
+
+    _status_fields: frozenset[str] = frozenset()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if the update changed one of this entity's fields."""
+        changed = self.coordinator.changed_fields
+        if changed is not None and changed.isdisjoint(self._status_fields):
+            return
+        super()._handle_coordinator_update()
@@ -12,7 +12,6 @@ from homeassistant.components.fan import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -23,6 +22,7 @@ from .const import (
     SPEED_MEDIUM,
 )
 from .coordinator import VisionAirCoordinator
+from .entity import VisionAirEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ async def async_setup_entry(
     async_add_entities([VisionAirFan(coordinator, entry)])
 
 
-class VisionAirFan(CoordinatorEntity[VisionAirCoordinator], FanEntity):
+class VisionAirFan(VisionAirEntity, FanEntity):
     """Representation of a VisionAir ventilation fan."""
 
     _attr_has_entity_name = True
@@ -65,6 +65,7 @@ class VisionAirFan(CoordinatorEntity[VisionAirCoordinator], FanEntity):
     )
     _attr_speed_count = 3
     _attr_preset_modes = PRESET_MODES
+    _status_fields = frozenset({"airflow_mode", "boost_active"})
 
     def __init__(
         self,
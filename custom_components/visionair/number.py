@@ -9,10 +9,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import VisionAirCoordinator
+from .entity import VisionAirEntity
 
 
 async def async_setup_entry(
@@ -28,7 +28,7 @@ async def async_setup_entry(
     ])
 
 
-class VisionAirHolidayDays(CoordinatorEntity[VisionAirCoordinator], NumberEntity):
+class VisionAirHolidayDays(VisionAirEntity, NumberEntity):
     """Number entity for setting holiday mode duration."""
 
     _attr_has_entity_name = True
@@ -39,6 +39,7 @@ class VisionAirHolidayDays(CoordinatorEntity[VisionAirCoordinator], NumberEntity
     _attr_native_unit_of_measurement = UnitOfTime.DAYS
     _attr_mode = NumberMode.BOX
     _attr_icon = "mdi:palm-tree"
+    _status_fields = frozenset({"holiday_days"})
 
     def __init__(
         self,
@@ -67,7 +68,7 @@ class VisionAirHolidayDays(CoordinatorEntity[VisionAirCoordinator], NumberEntity
         await self.coordinator.async_set_holiday(int(value))
 
 
-class VisionAirPreheatTemperature(CoordinatorEntity[VisionAirCoordinator], NumberEntity):
+class VisionAirPreheatTemperature(VisionAirEntity, NumberEntity):
     """Number entity for setting preheat temperature."""
 
     _attr_has_entity_name = True
@@ -78,6 +79,7 @@ class VisionAirPreheatTemperature(CoordinatorEntity[VisionAirCoordinator], Numbe
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:thermometer"
+    _status_fields = frozenset({"preheat_temp"})
 
     def __init__(
         self,
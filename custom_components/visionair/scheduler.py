@@ -0,0 +1,148 @@
+"""Shared BLE connection scheduling for VisionAir devices.
+
+Every config entry connects through whichever adapter or proxy Home
+Assistant routes it to. Proxies only have a few connection slots, so when
+several units share one, their polls and commands are coordinated here
+instead of each coordinator connecting on its own timer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .const import MAX_CONNECTIONS_PER_SOURCE, POLL_SPACING
+
+
+@dataclass
+class _Source:
+    """Connection slots of one adapter or proxy."""
+
+    active: int = 0
+    next_poll: float = 0.0
+    commands: deque[asyncio.Future[None]] = field(default_factory=deque)
+    polls: deque[asyncio.Future[None]] = field(default_factory=deque)
+    holders: dict[int, Callable[[], bool]] = field(default_factory=dict)
+    # Holders that agreed to close their idle connection
+    releasing: set[int] = field(default_factory=set)
+
+
+class VisionAirScheduler:
+    """Hands out connection slots per adapter or proxy.
+
+    At most ``max_connections`` connections are open per source. Waiters
+    are served in arrival order, commands before polls, so a busy source
+    never starves a user action behind background polls. Poll starts on a
+    source are spaced ``poll_spacing`` seconds apart, which staggers entries
+    that were set up at the same time.
+
+    When a slot is needed, holders whose connections are only being kept
+    alive are asked to release them, one per waiter. Holders that are busy
+    at that moment should check has_waiters() when their operation ends.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS_PER_SOURCE,
+        poll_spacing: float = POLL_SPACING,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.max_connections = max_connections
+        self.poll_spacing = poll_spacing
+        self._sources: dict[str, _Source] = {}
+        self._next_token = 0
+
+    async def async_acquire(
+        self,
+        source: str,
+        *,
+        command: bool,
+        release_idle: Callable[[], bool],
+    ) -> Callable[[], None]:
+        """Wait for a connection slot on a source.
+
+        Args:
+            source: Adapter or proxy the connection will go through
+            command: True for user commands, False for polls
+            release_idle: Called when another entry needs the slot; should
+                close the connection if it is only being kept alive and
+                return whether it does
+
+        Returns:
+            Callback that releases the slot; safe to call more than once
+        """
+        src = self._sources.setdefault(source, _Source())
+        loop = asyncio.get_running_loop()
+
+        if not command:
+            now = loop.time()
+            start = max(now, src.next_poll)
+            src.next_poll = start + self.poll_spacing
+            if start > now:
+                await asyncio.sleep(start - now)
+
+        if src.active >= self.max_connections or src.commands or src.polls:
+            waiter: asyncio.Future[None] = loop.create_future()
+            queue = src.commands if command else src.polls
+            queue.append(waiter)
+            self._release_idle_holders(src)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just before the cancellation
+                    self._release(src)
+                elif waiter in queue:
+                    queue.remove(waiter)
+                raise
+        else:
+            src.active += 1
+
+        token = self._next_token
+        self._next_token += 1
+        src.holders[token] = release_idle
+
+        def release() -> None:
+            src.releasing.discard(token)
+            if src.holders.pop(token, None) is not None:
+                self._release(src)
+
+        return release
+
+    def has_waiters(self, source: str) -> bool:
+        """Return True if polls or commands on source wait for a slot.
+
+        Waiters that an idle holder is already releasing a slot for don't
+        count.
+        """
+        src = self._sources.get(source)
+        return src is not None and _waiting(src) > len(src.releasing)
+
+    @staticmethod
+    def _release_idle_holders(src: _Source) -> None:
+        """Ask idle holders to close, until each waiter has a slot coming."""
+        needed = _waiting(src) - len(src.releasing)
+        for token, release_idle in list(src.holders.items()):
+            if needed <= 0:
+                return
+            if token not in src.releasing and release_idle():
+                src.releasing.add(token)
+                needed -= 1
+
+    @staticmethod
+    def _release(src: _Source) -> None:
+        """Hand a slot to the next waiter, or free it."""
+        for queue in (src.commands, src.polls):
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        src.active -= 1
+
+
+def _waiting(src: _Source) -> int:
+    """Return how many polls and commands wait for a slot on src."""
+    return sum(not waiter.done() for waiter in (*src.commands, *src.polls))
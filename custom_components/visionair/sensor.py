@@ -1,25 +1,33 @@
 """Sensor platform for VisionAir integration.
 
-Sensors are auto-generated from field metadata in DeviceStatus.
+Sensors are auto-generated from field metadata in DeviceStatus, plus
+sensors derived from those readings.
 """
 
 from __future__ import annotations
 
-import dataclasses
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
-from .visionair_ble import DeviceStatus
+from .visionair_ble import DEVICE_STATUS_SENSORS, DeviceStatus, SensorDescriptor
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfPower,
     UnitOfTemperature,
     UnitOfTime,
+    UnitOfVolume,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -27,6 +35,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import VisionAirCoordinator
+from .derived import absolute_humidity, heat_recovery_efficiency, thermal_power
+from .entity import VisionAirEntity
 
 
 # Map library units to HA units
@@ -38,6 +48,9 @@ UNIT_MAP = {
     "m³": "m³",
 }
 
+# HA has no unit constant for absolute humidity in the supported versions
+ABSOLUTE_HUMIDITY_UNIT = "g/m³"
+
 # Map library device_class to HA SensorDeviceClass
 DEVICE_CLASS_MAP = {
     "temperature": SensorDeviceClass.TEMPERATURE,
@@ -54,6 +67,76 @@ STATE_CLASS_MAP = {
 }
 
 
+@dataclass(frozen=True, kw_only=True)
+class VisionAirSensorEntityDescription(SensorEntityDescription):
+    """Describes a VisionAir sensor computed from DeviceStatus fields."""
+
+    value_fn: Callable[[DeviceStatus], Any]
+    # Fields the value is computed from; empty means the field named by key
+    status_fields: frozenset[str] = frozenset()
+
+
+def _describe(desc: SensorDescriptor) -> VisionAirSensorEntityDescription:
+    """Map a library sensor descriptor to its HA entity description."""
+    return VisionAirSensorEntityDescription(
+        key=desc.key,
+        translation_key=desc.key,
+        native_unit_of_measurement=UNIT_MAP.get(desc.unit, desc.unit),
+        device_class=DEVICE_CLASS_MAP.get(desc.device_class),
+        state_class=STATE_CLASS_MAP.get(desc.state_class),
+        entity_registry_enabled_default=desc.enabled_default,
+        options=desc.options,
+        suggested_display_precision=desc.precision,
+        value_fn=desc.getter,
+    )
+
+
+SENSOR_DESCRIPTIONS: tuple[VisionAirSensorEntityDescription, ...] = tuple(
+    _describe(desc) for desc in DEVICE_STATUS_SENSORS
+)
+
+DERIVED_SENSOR_DESCRIPTIONS: tuple[VisionAirSensorEntityDescription, ...] = (
+    VisionAirSensorEntityDescription(
+        key="heat_recovery_efficiency",
+        translation_key="heat_recovery_efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=heat_recovery_efficiency,
+        status_fields=frozenset({"temp_probe1", "temp_probe2", "temp_remote"}),
+    ),
+    VisionAirSensorEntityDescription(
+        key="thermal_power",
+        translation_key="thermal_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=thermal_power,
+        status_fields=frozenset({"airflow", "temp_probe1", "temp_probe2"}),
+    ),
+    VisionAirSensorEntityDescription(
+        key="absolute_humidity_remote",
+        translation_key="absolute_humidity_remote",
+        native_unit_of_measurement=ABSOLUTE_HUMIDITY_UNIT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: absolute_humidity(data.temp_remote, data.humidity_remote),
+        status_fields=frozenset({"temp_remote", "humidity_remote"}),
+    ),
+    VisionAirSensorEntityDescription(
+        key="absolute_humidity_probe1",
+        translation_key="absolute_humidity_probe1",
+        native_unit_of_measurement=ABSOLUTE_HUMIDITY_UNIT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: absolute_humidity(data.temp_probe1, data.humidity_probe1),
+        status_fields=frozenset({"temp_probe1", "humidity_probe1"}),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -62,54 +145,157 @@ async def async_setup_entry(
     """Set up VisionAir sensors from a config entry."""
     coordinator: VisionAirCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for field_info in dataclasses.fields(DeviceStatus):
-        meta = field_info.metadata
-        if not meta.get("sensor"):
-            continue
-
-        entities.append(VisionAirSensor(
-            coordinator=coordinator,
-            entry=entry,
-            field_name=field_info.name,
-            unit=UNIT_MAP.get(meta.get("unit"), meta.get("unit")),
-            device_class=DEVICE_CLASS_MAP.get(meta.get("device_class")),
-            state_class=STATE_CLASS_MAP.get(meta.get("state_class")),
-            enabled_default=meta.get("enabled_default", True),
-            options=meta.get("options"),
-            precision=meta.get("precision"),
-        ))
+    entities: list[SensorEntity] = [
+        VisionAirSensor(coordinator, entry, description)
+        for description in SENSOR_DESCRIPTIONS + DERIVED_SENSOR_DESCRIPTIONS
+    ]
+    entities.append(VisionAirAirVolumeSensor(coordinator, entry))
+
+    entities.append(VisionAirPresenceSensor(
+        coordinator=coordinator,
+        entry=entry,
+        key="rssi",
+        unit=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+    ))
+    entities.append(VisionAirPresenceSensor(
+        coordinator=coordinator,
+        entry=entry,
+        key="last_seen",
+        unit=None,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_class=None,
+    ))
+    entities.append(VisionAirStatsSensor(
+        coordinator=coordinator,
+        entry=entry,
+        key="last_poll_duration",
+        unit=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        precision=1,
+    ))
+    entities.append(VisionAirStatsSensor(
+        coordinator=coordinator,
+        entry=entry,
+        key="poll_success_rate",
+        unit=PERCENTAGE,
+        device_class=None,
+        precision=0,
+    ))
 
     async_add_entities(entities)
 
 
-class VisionAirSensor(CoordinatorEntity[VisionAirCoordinator], SensorEntity):
+class VisionAirSensor(VisionAirEntity, SensorEntity):
     """Representation of a VisionAir sensor."""
 
     _attr_has_entity_name = True
+    entity_description: VisionAirSensorEntityDescription
 
     def __init__(
         self,
         coordinator: VisionAirCoordinator,
         entry: ConfigEntry,
-        field_name: str,
+        description: VisionAirSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._status_fields = description.status_fields or frozenset({description.key})
+        self._attr_unique_id = f"{entry.data['address']}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.data["address"])},
+            "name": entry.title,
+            "manufacturer": "Ventilairsec",
+            "model": "VisionAir",
+        }
+
+    @property
+    def native_value(self) -> Any:
+        """Return the sensor value."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.data)
+
+
+class VisionAirPresenceSensor(CoordinatorEntity[VisionAirCoordinator], SensorEntity):
+    """Diagnostic sensor fed by the device's Bluetooth advertisements.
+
+    Stays available while polls fail or the device is out of range, so it
+    shows when the device was last in range.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: VisionAirCoordinator,
+        entry: ConfigEntry,
+        key: str,
         unit: str | None,
-        device_class: SensorDeviceClass | None,
+        device_class: SensorDeviceClass,
         state_class: SensorStateClass | None,
-        enabled_default: bool,
-        options: list[str] | None,
-        precision: int | None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._field_name = field_name
-        self._attr_translation_key = field_name
-        self._attr_unique_id = f"{entry.data['address']}_{field_name}"
+        self._key = key
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.data['address']}_{key}"
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_state_class = state_class
-        self._attr_entity_registry_enabled_default = enabled_default
-        self._attr_options = options
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.data["address"])},
+            "name": entry.title,
+            "manufacturer": "Ventilairsec",
+            "model": "VisionAir",
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True; these sensors matter most when polls fail.
+
+        Before the first advertisement the state is unknown rather than
+        unavailable.
+        """
+        return True
+
+    @property
+    def native_value(self) -> Any:
+        """Return the value from the last advertisement."""
+        return getattr(self.coordinator, self._key)
+
+
+class VisionAirStatsSensor(CoordinatorEntity[VisionAirCoordinator], SensorEntity):
+    """Diagnostic sensor for the coordinator's poll statistics.
+
+    Stays available while polls fail, since that is when it matters.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: VisionAirCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        unit: str,
+        device_class: SensorDeviceClass | None,
+        precision: int,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.data['address']}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
         self._attr_suggested_display_precision = precision
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.data["address"])},
@@ -118,9 +304,54 @@ class VisionAirSensor(CoordinatorEntity[VisionAirCoordinator], SensorEntity):
             "model": "VisionAir",
         }
 
+    @property
+    def available(self) -> bool:
+        """Return True; the stats are known even when the device is not."""
+        return True
+
     @property
     def native_value(self) -> Any:
-        """Return the sensor value."""
-        if self.coordinator.data is None:
-            return None
-        return getattr(self.coordinator.data, self._field_name, None)
+        """Return the statistic."""
+        return getattr(self.coordinator.stats, self._key)
+
+
+class VisionAirAirVolumeSensor(CoordinatorEntity[VisionAirCoordinator], RestoreSensor):
+    """Total air volume moved, integrated from the polled airflow.
+
+    The running total lives in the coordinator; the last state is restored
+    on startup so the total keeps increasing across restarts.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "air_volume"
+    _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
+    _attr_device_class = SensorDeviceClass.VOLUME
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        coordinator: VisionAirCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.data['address']}_air_volume"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.data["address"])},
+            "name": entry.title,
+            "manufacturer": "Ventilairsec",
+            "model": "VisionAir",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Continue the total from the last state."""
+        await super().async_added_to_hass()
+        last = await self.async_get_last_sensor_data()
+        if last is not None and last.native_value is not None:
+            self.coordinator.air_volume.total += float(last.native_value)
+
+    @property
+    def native_value(self) -> float:
+        """Return the total volume in m³."""
+        return self.coordinator.air_volume.total
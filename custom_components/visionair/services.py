@@ -0,0 +1,59 @@
+"""Services for VisionAir integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FORCE,
+    DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+    SPEED_HIGH,
+    SPEED_LOW,
+    SPEED_MEDIUM,
+)
+from .coordinator import VisionAirCoordinator
+
+APPLY_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        vol.Optional("airflow_mode"): vol.In([SPEED_LOW, SPEED_MEDIUM, SPEED_HIGH]),
+        vol.Optional("boost"): cv.boolean,
+        vol.Optional("preheat"): cv.boolean,
+        vol.Optional("preheat_temperature"): vol.All(
+            vol.Coerce(int), vol.Range(min=12, max=18)
+        ),
+        vol.Optional("summer_limit"): cv.boolean,
+        vol.Optional("holiday_days"): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=255)
+        ),
+    }
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register VisionAir services."""
+
+    async def async_apply_settings(call: ServiceCall) -> None:
+        """Apply several settings to one device over a single connection."""
+        changes = dict(call.data)
+        entry_id = changes.pop(ATTR_CONFIG_ENTRY_ID)
+        force = changes.pop(ATTR_FORCE)
+        coordinator: VisionAirCoordinator | None = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            raise ServiceValidationError(f"VisionAir config entry {entry_id} is not loaded")
+        if changes:
+            await coordinator.async_apply(changes, force=force)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        async_apply_settings,
+        schema=APPLY_SETTINGS_SCHEMA,
+    )
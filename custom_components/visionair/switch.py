@@ -12,16 +12,17 @@ from homeassistant.components.switch import SwitchEntity, SwitchEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import VisionAirCoordinator
+from .entity import VisionAirEntity
 
 
 @dataclass(frozen=True, kw_only=True)
 class VisionAirSwitchEntityDescription(SwitchEntityDescription):
     """Describes a VisionAir switch entity."""
 
+    status_field: str
     value_fn: Callable[[DeviceStatus], bool]
     turn_on_fn: Callable[[VisionAirCoordinator], Coroutine[Any, Any, None]]
     turn_off_fn: Callable[[VisionAirCoordinator], Coroutine[Any, Any, None]]
@@ -31,6 +32,7 @@ SWITCH_DESCRIPTIONS: tuple[VisionAirSwitchEntityDescription, ...] = (
     VisionAirSwitchEntityDescription(
         key="preheat",
         translation_key="preheat",
+        status_field="preheat_enabled",
         value_fn=lambda data: data.preheat_enabled,
         turn_on_fn=lambda coord: coord.async_set_preheat(True),
         turn_off_fn=lambda coord: coord.async_set_preheat(False),
@@ -38,6 +40,7 @@ SWITCH_DESCRIPTIONS: tuple[VisionAirSwitchEntityDescription, ...] = (
     VisionAirSwitchEntityDescription(
         key="summer_limit",
         translation_key="summer_limit",
+        status_field="summer_limit_enabled",
         value_fn=lambda data: data.summer_limit_enabled,
         turn_on_fn=lambda coord: coord.async_set_summer_limit(True),
         turn_off_fn=lambda coord: coord.async_set_summer_limit(False),
@@ -45,6 +48,7 @@ SWITCH_DESCRIPTIONS: tuple[VisionAirSwitchEntityDescription, ...] = (
     VisionAirSwitchEntityDescription(
         key="boost",
         translation_key="boost",
+        status_field="boost_active",
         value_fn=lambda data: data.boost_active,
         turn_on_fn=lambda coord: coord.async_set_boost(True),
         turn_off_fn=lambda coord: coord.async_set_boost(False),
@@ -66,7 +70,7 @@ async def async_setup_entry(
     )
 
 
-class VisionAirSwitch(CoordinatorEntity[VisionAirCoordinator], SwitchEntity):
+class VisionAirSwitch(VisionAirEntity, SwitchEntity):
     """Representation of a VisionAir switch."""
 
     _attr_has_entity_name = True
@@ -81,6 +85,7 @@ class VisionAirSwitch(CoordinatorEntity[VisionAirCoordinator], SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._status_fields = frozenset({description.status_field})
         self._attr_unique_id = f"{entry.data['address']}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.data["address"])},
@@ -42,13 +42,15 @@ Via ESPHome Proxy:
 
 from __future__ import annotations
 
-from .client import VisionAirClient
+from .client import APPLY_SETTINGS, ClientStats, FetchStrategy, VisionAirClient
 from .protocol import (
     # Constants
     AIRFLOW_HIGH,
     AIRFLOW_LOW,
     AIRFLOW_MEDIUM,
     COMMAND_CHAR_UUID,
+    DEVICE_STATUS_SENSORS,
+    SENSOR_DATA_SENSORS,
     STATUS_CHAR_UUID,
     VISIONAIR_MAC_PREFIX,
     # Data classes
@@ -56,6 +58,7 @@ from .protocol import (
     ScheduleConfig,
     ScheduleSlot,
     SensorData,
+    SensorDescriptor,
     # Functions
     build_boost_command,
     build_full_data_request,
@@ -84,18 +87,24 @@ __all__ = [
     "__version__",
     # Primary interface
     "VisionAirClient",
+    "FetchStrategy",
+    "ClientStats",
     # Data classes
     "DeviceStatus",
     "ScheduleConfig",
     "ScheduleSlot",
     "SensorData",
+    "SensorDescriptor",
     # Constants
+    "APPLY_SETTINGS",
     "AIRFLOW_LOW",
     "AIRFLOW_MEDIUM",
     "AIRFLOW_HIGH",
     "STATUS_CHAR_UUID",
     "COMMAND_CHAR_UUID",
     "VISIONAIR_MAC_PREFIX",
+    "DEVICE_STATUS_SENSORS",
+    "SENSOR_DATA_SENSORS",
     # Protocol functions (for advanced use)
     "build_boost_command",
     "build_full_data_request",
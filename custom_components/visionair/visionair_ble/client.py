@@ -15,14 +15,20 @@ Example:
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from .protocol import (
     AIRFLOW_HIGH,
     AIRFLOW_LOW,
     AIRFLOW_MEDIUM,
+    CMD_HANDLE,
     COMMAND_CHAR_UUID,
     MAGIC,
+    NOTIFY_HANDLE,
     STATUS_CHAR_UUID,
     AirflowLevel,
     DeviceStatus,
@@ -51,6 +57,111 @@ if TYPE_CHECKING:
     from bleak import BleakClient
 
 
+class FetchStrategy:
+    """How get_fresh_status() collects DEVICE_STATE, SCHEDULE and PROBE_SENSORS."""
+
+    # One FULL_DATA request; the device answers with ACK, DEVICE_STATE,
+    # SCHEDULE and PROBE_SENSORS. A missing SCHEDULE is asked for with one
+    # more FULL_DATA request, other missing packets with their own request.
+    # Used on direct adapters.
+    PIPELINED = "pipelined"
+    # FULL_DATA, DEVICE_STATE and PROBE_SENSORS requests sent one at a time.
+    # Used through ESPHome proxies, which may forward only the first
+    # notification per write.
+    SEQUENTIAL = "sequential"
+
+
+_T = TypeVar("_T")
+
+_MAGIC_0, _MAGIC_1 = MAGIC
+
+# Stands in for a missing PROBE_SENSORS response (all readings None)
+_NO_SENSORS = SensorData()
+
+# The base status of get_fresh_status() with its readings cleared, so they
+# all come from the current fetch
+_NO_READINGS = dict.fromkeys(
+    ("temp_remote", "humidity_remote", "temp_probe1", "temp_probe2", "humidity_probe1")
+)
+
+# Names used in error messages, keyed by the expected response packet type
+_RESPONSE_NAMES: dict[int, str] = {
+    PacketType.DEVICE_STATE: "status",
+    PacketType.SCHEDULE: "schedule",
+    PacketType.PROBE_SENSORS: "sensor",
+    PacketType.SCHEDULE_CONFIG: "schedule config",
+    PacketType.ACK: "acknowledgment",
+}
+
+
+@dataclass
+class ClientStats:
+    """Traffic counters and phase timings of VisionAirClient.
+
+    Pass the same instance to successive clients to accumulate across
+    connections. ``timeouts`` counts per expected response ("status",
+    "sensor", ...). ``timings`` holds the duration in seconds of the most
+    recent service lookup ("discovery"), notification subscription
+    ("subscribe"), write ("write"), wait for a response ("response") and
+    get_fresh_status() call ("fetch").
+    """
+
+    requests: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    notifications: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    invalid_responses: int = 0
+    timeouts: dict[str, int] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def add_timeout(self, name: str) -> None:
+        """Count a response that didn't arrive in time."""
+        self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+
+def _raw(data: bytes) -> bytes:
+    """Parser for responses that are used as-is."""
+    return data
+
+
+# Settings accepted by VisionAirClient.apply(): key -> (DeviceStatus field,
+# setter method). Writes are sent in this order; boost goes last so that it
+# starts from the final airflow mode.
+APPLY_SETTINGS: dict[str, tuple[str, str]] = {
+    "airflow_mode": ("airflow_mode", "set_airflow_mode"),
+    "preheat": ("preheat_enabled", "set_preheat"),
+    "preheat_temperature": ("preheat_temp", "set_preheat_temperature"),
+    "summer_limit": ("summer_limit_enabled", "set_summer_limit"),
+    "holiday_days": ("holiday_days", "set_holiday"),
+    "boost": ("boost_active", "set_boost"),
+}
+
+
+_AIRFLOW_MODES: dict[int, str] = {
+    AIRFLOW_LOW: "low",
+    AIRFLOW_MEDIUM: "medium",
+    AIRFLOW_HIGH: "high",
+}
+
+
+# (status, command) characteristic handles per device address, shared by all
+# clients so that reconnecting doesn't rescan every service. Devices not yet
+# seen start from the documented protocol handles.
+_handle_cache: dict[str, tuple[int, int]] = {}
+
+
+def _is_proxy_client(client: Any) -> bool:
+    """Return True if client talks to the device through an ESPHome proxy.
+
+    HA's BleakClient wrapper keeps the real backend in ``_backend``;
+    standalone proxy connections use ESPHomeClient directly.
+    """
+    backend = getattr(client, "_backend", None) or client
+    return "esphome" in type(backend).__module__.lower()
+
+
 class VisionAirClient:
     """Client for controlling VisionAir ventilation devices.
 
@@ -61,10 +172,25 @@ class VisionAirClient:
     The caller is responsible for connection lifecycle - this class
     provides the protocol operations only.
 
+    By default each operation subscribes to notifications for the duration
+    of its request. Callers that keep the connection open can call
+    start_notifications() once; all notifications are then routed by packet
+    type to the waiting operation, so a command costs one write plus its
+    response.
+
     Works with both BleakClient (direct) and ESPHomeClient (proxy).
 
     Args:
         client: Connected BleakClient or compatible (e.g., ESPHomeClient)
+        fetch_strategy: FetchStrategy used by get_fresh_status(). If None,
+            SEQUENTIAL is used through ESPHome proxies and PIPELINED otherwise.
+        retries: How many times a request is resent after a timeout
+        status_max_age: How old (seconds) last_status may be and still count
+            as the device's current state. Setters skip the write when such
+            a status already has the requested value; pass force=True to
+            write anyway. 0 (the default) disables skipping.
+        stats: ClientStats to record traffic in (default: a new one,
+            available as ``stats``)
 
     Example:
         async with BleakClient(device) as client:
@@ -74,11 +200,242 @@ class VisionAirClient:
             await visionair.set_airflow_mode("medium")
     """
 
-    def __init__(self, client: "BleakClient") -> None:
+    def __init__(
+        self,
+        client: "BleakClient",
+        fetch_strategy: str | None = None,
+        retries: int = 0,
+        status_max_age: float = 0.0,
+        stats: ClientStats | None = None,
+    ) -> None:
         self._client = client
+        self.stats = stats if stats is not None else ClientStats()
+        self.retries = retries
+        self.status_max_age = status_max_age
+        self._last_status_time: float | None = None
+        if fetch_strategy is None:
+            fetch_strategy = (
+                FetchStrategy.SEQUENTIAL
+                if _is_proxy_client(client)
+                else FetchStrategy.PIPELINED
+            )
+        self.fetch_strategy = fetch_strategy
         self._last_status: DeviceStatus | None = None
         self._status_char: Any = None
         self._command_char: Any = None
+        self._notifying = False
+        self._waiters: dict[int, list[asyncio.Future[bytes]]] = {}
+        self._listeners: list[Callable[[bytes], None]] = []
+
+    async def start_notifications(self) -> None:
+        """Subscribe to device notifications until stop_notifications().
+
+        While subscribed, operations skip their own start_notify/stop_notify
+        round-trips and receive responses through the packet dispatcher.
+        """
+        self._find_characteristics()
+        if self._notifying:
+            return
+        await self._start_notify()
+        self._notifying = True
+
+    async def stop_notifications(self) -> None:
+        """Unsubscribe from device notifications."""
+        if not self._notifying:
+            return
+        self._notifying = False
+        await self._stop_notify()
+
+    @asynccontextmanager
+    async def _notifications(self) -> AsyncIterator[None]:
+        """Ensure notifications are subscribed for the duration of a request."""
+        if self._notifying:
+            yield
+            return
+
+        await self._start_notify()
+        self._notifying = True
+        try:
+            yield
+        finally:
+            self._notifying = False
+            await self._stop_notify()
+
+    def add_listener(self, listener: Callable[[bytes], None]) -> Callable[[], None]:
+        """Pass every valid packet to listener, including unsolicited ones.
+
+        Packets only arrive while notifications are subscribed, so callers
+        that want state changes made elsewhere (RF remote, VMI app) should
+        call start_notifications() and keep the connection open.
+
+        Args:
+            listener: Called with the raw packet; must not block
+
+        Returns:
+            Callback that removes the listener
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    @asynccontextmanager
+    async def _listen(self, listener: Callable[[bytes], None]) -> AsyncIterator[None]:
+        """Pass every valid packet to listener while the context is active."""
+        remove = self.add_listener(listener)
+        try:
+            yield
+        finally:
+            remove()
+
+    def _on_notification(self, *args: Any) -> None:
+        """Dispatch a notification to the futures waiting for its packet type.
+
+        The header is checked in place and the buffer is handed on as is;
+        backends deliver a fresh buffer per notification.
+        """
+        data = args[-1]  # data is always last arg
+        if len(data) < 3 or data[0] != _MAGIC_0 or data[1] != _MAGIC_1:
+            return
+        self.stats.notifications += 1
+        self.stats.bytes_received += len(data)
+
+        for future in self._waiters.pop(data[2], ()):
+            if not future.done():
+                future.set_result(data)
+        for listener in list(self._listeners):
+            listener(data)
+
+    def _expect(self, *packet_types: int) -> asyncio.Future[bytes]:
+        """Return a future resolved by the next packet of any given type."""
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        for packet_type in packet_types:
+            self._waiters.setdefault(packet_type, []).append(future)
+        return future
+
+    def _discard(self, future: asyncio.Future[bytes]) -> None:
+        """Remove a future from the dispatcher and cancel it if still pending."""
+        for packet_type, waiters in list(self._waiters.items()):
+            if future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[packet_type]
+        future.cancel()
+
+    async def _write(self, packet: bytes) -> None:
+        """Write a packet to the command characteristic."""
+        start = time.monotonic()
+        await self._client.write_gatt_char(self._command_char, packet, response=True)
+        self.stats.timings["write"] = time.monotonic() - start
+        self.stats.writes += 1
+        self.stats.bytes_written += len(packet)
+
+    async def _wait(self, awaitable: Any, timeout: float, name: str) -> Any:
+        """Wait for a response, recording the wait time or the timeout."""
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=timeout)
+        except TimeoutError:
+            self.stats.add_timeout(name)
+            raise
+        self.stats.timings["response"] = time.monotonic() - start
+        return result
+
+    async def _transact(
+        self,
+        packet: bytes,
+        expect: tuple[int, ...],
+        parser: Callable[[bytes], _T | None],
+        *,
+        timeout: float,
+        retries: int | None = None,
+    ) -> _T:
+        """Send one request and return the parsed response.
+
+        All request/response operations go through here. The response
+        future is registered before the write so a fast reply can't be
+        missed, and is always removed from the dispatcher on the way out,
+        including on timeout or cancellation. Timeouts are retried by
+        resending the request, which is safe because every request sets
+        an absolute value.
+
+        Args:
+            packet: Request packet to write
+            expect: Packet types that answer this request
+            parser: Turns the response into a result; returning None marks
+                the response as invalid
+            timeout: How long to wait for each attempt in seconds
+            retries: Extra attempts after a timeout (default: self.retries)
+
+        Raises:
+            TimeoutError: If no matching response after all attempts
+            ValueError: If the parser rejects the response
+        """
+        self._find_characteristics()
+        if retries is None:
+            retries = self.retries
+        name = _RESPONSE_NAMES.get(expect[0], "device")
+        self.stats.requests += 1
+
+        async with self._notifications():
+            attempt = 0
+            while True:
+                response = self._expect(*expect)
+                try:
+                    await self._write(packet)
+                    data = await self._wait(response, timeout, name)
+                except TimeoutError:
+                    if attempt >= retries:
+                        raise TimeoutError(f"No {name} response received") from None
+                    attempt += 1
+                    self.stats.retries += 1
+                    continue
+                finally:
+                    self._discard(response)
+                break
+
+        result = parser(data)
+        if result is None:
+            self.stats.invalid_responses += 1
+            raise ValueError(f"Invalid {name} response")
+        return result
+
+    def _set_last_status(self, status: DeviceStatus) -> None:
+        """Record a status received from the device."""
+        self._last_status = status
+        self._last_status_time = time.monotonic()
+
+    def _status_age(self) -> float | None:
+        """Seconds since last_status was received, or None if there is none."""
+        if self._last_status_time is None:
+            return None
+        return time.monotonic() - self._last_status_time
+
+    def _is_current(self, field_name: str, value: Any, force: bool) -> bool:
+        """Return True if a fresh enough last_status already has this value."""
+        if force or self._last_status is None:
+            return False
+        age = self._status_age()
+        if age is None or age > self.status_max_age:
+            return False
+        return getattr(self._last_status, field_name) == value
+
+    async def _command(self, packet: bytes, *, timeout: float) -> DeviceStatus:
+        """Send a request answered by DEVICE_STATE and record the new status."""
+        status = await self._transact(
+            packet, (PacketType.DEVICE_STATE,), parse_status, timeout=timeout
+        )
+        self._set_last_status(status)
+        return status
+
+    async def _start_notify(self) -> None:
+        """Subscribe to status notifications."""
+        start = time.monotonic()
+        await self._client.start_notify(self._status_char, self._on_notification)
+        self.stats.timings["subscribe"] = time.monotonic() - start
 
     async def _stop_notify(self) -> None:
         """Stop notifications, ignoring errors if already disconnected.
@@ -97,11 +454,34 @@ class VisionAirClient:
 
         ESPHomeClient requires characteristic objects, not UUID strings.
         BleakClient accepts both, so we use objects for compatibility.
+
+        Handles resolved on an earlier connection are looked up directly and
+        only checked against the expected UUIDs; the full service scan runs
+        only when that check fails.
         """
         if self._status_char is not None:
             return
 
-        for svc in self._client.services:
+        start = time.monotonic()
+        services = self._client.services
+        address = getattr(self._client, "address", None)
+        status_handle, command_handle = _handle_cache.get(
+            address, (NOTIFY_HANDLE, CMD_HANDLE)
+        )
+        status_char = services.get_characteristic(status_handle)
+        command_char = services.get_characteristic(command_handle)
+        if (
+            status_char is not None
+            and command_char is not None
+            and status_char.uuid == STATUS_CHAR_UUID
+            and command_char.uuid == COMMAND_CHAR_UUID
+        ):
+            self._status_char = status_char
+            self._command_char = command_char
+            self.stats.timings["discovery"] = time.monotonic() - start
+            return
+
+        for svc in services:
             for char in svc.characteristics:
                 if char.uuid == STATUS_CHAR_UUID:
                     self._status_char = char
@@ -114,6 +494,13 @@ class VisionAirClient:
                 f"Expected {STATUS_CHAR_UUID} and {COMMAND_CHAR_UUID}"
             )
 
+        if address is not None:
+            _handle_cache[address] = (
+                self._status_char.handle,
+                self._command_char.handle,
+            )
+        self.stats.timings["discovery"] = time.monotonic() - start
+
     async def get_status(self, timeout: float = 10.0) -> DeviceStatus:
         """Get current device status.
 
@@ -126,36 +513,7 @@ class VisionAirClient:
         Raises:
             TimeoutError: If no response within timeout
         """
-        self._find_characteristics()
-
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]  # data is always last arg
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_status_request(), response=True
-            )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        return await self._command(build_status_request(), timeout=timeout)
 
     async def get_sensors(self, timeout: float = 10.0) -> SensorData:
         """Get live sensor measurements (temperatures, humidity).
@@ -169,142 +527,182 @@ class VisionAirClient:
         Raises:
             TimeoutError: If no response within timeout
         """
-        self._find_characteristics()
-
-        sensor_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal sensor_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.PROBE_SENSORS:
-                sensor_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_sensor_request(), response=True
-            )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not sensor_data:
-            raise TimeoutError("No sensor response received")
-
-        sensors = parse_sensors(sensor_data)
-        if not sensors:
-            raise ValueError("Invalid sensor response")
-
-        return sensors
+        return await self._transact(
+            build_sensor_request(),
+            (PacketType.PROBE_SENSORS,),
+            parse_sensors,
+            timeout=timeout,
+        )
 
     async def get_fresh_status(
         self,
         timeout: float = 5.0,
+        strategy: str | None = None,
+        base: DeviceStatus | None = None,
     ) -> DeviceStatus:
         """Get device status with fresh sensor readings.
 
-        Sends three separate requests to collect all sensor data:
+        Collects three packets:
         - DEVICE_STATE (0x01): device config and airflow mode
         - PROBE_SENSORS (0x03): probe temperatures and humidity
-        - FULL_DATA_Q (0x06): triggers SCHEDULE (0x02) with remote temperature/humidity
+        - SCHEDULE (0x02): remote temperature/humidity, only sent in
+          response to FULL_DATA_Q (0x06)
 
-        Separate requests are needed because some BLE proxies (e.g. ESPHome)
-        only forward one notification per write command. FULL_DATA_Q returns
-        multiple packets but the proxy may drop all but the first.
+        With FetchStrategy.PIPELINED a single FULL_DATA_Q request returns all
+        three. With FetchStrategy.SEQUENTIAL, FULL_DATA_Q, DEVICE_STATE and
+        PROBE_SENSORS requests are sent separately, because some BLE proxies
+        (e.g. ESPHome) only forward one notification per write command.
 
         Sensor data sources:
         - Remote temperature/humidity: SCHEDULE packet bytes 11/13
         - Probe 1 temp/humidity: PROBE_SENSORS packet bytes 6/8
         - Probe 2 temperature: PROBE_SENSORS packet byte 11
 
+        Each request waits only for the packet type it asked for, and the
+        fetch finishes as soon as all three packets are in hand, whichever
+        request produced them.
+
+        Passing ``base`` refreshes only the readings: the separate
+        DEVICE_STATE request is skipped and the config fields come from
+        ``base``, unless a FULL_DATA response carries a DEVICE_STATE anyway.
+        The readings never come from ``base``; those of a packet that didn't
+        arrive are None. last_status is only updated when a DEVICE_STATE
+        arrived, so ``last_status is`` the result tells whether the config
+        fields are fresh.
+
         Args:
             timeout: How long to wait for each notification in seconds
+            strategy: FetchStrategy override (default: self.fetch_strategy)
+            base: Earlier status to reuse for the DEVICE_STATE fields
 
         Returns:
             DeviceStatus with fresh temperature and humidity readings
 
         Raises:
-            TimeoutError: If no status responses received at all
+            TimeoutError: If no status responses received at all (with
+                ``base``: if no sensor responses received at all)
         """
         self._find_characteristics()
-        from dataclasses import replace
-
-        probe_data: bytes | None = None
-        status_data: bytes | None = None
-        schedule_data: bytes | None = None
-        new_packet = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal probe_data, status_data, schedule_data
-            data = bytes(args[-1])
-            if bytes(data[:2]) != MAGIC:
-                return
-            if data[2] == PacketType.PROBE_SENSORS:
-                probe_data = data
-            elif data[2] == PacketType.DEVICE_STATE:
-                status_data = data
-            elif data[2] == PacketType.SCHEDULE:
-                schedule_data = data
-            new_packet.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
+
+        strategy = strategy or self.fetch_strategy
+        self.stats.requests += 1
+        start = time.monotonic()
+
+        # Each packet type we need, and the request that yields it on its own
+        steps = [
+            (build_full_data_request(), PacketType.SCHEDULE),
+            (build_status_request(), PacketType.DEVICE_STATE),
+            (build_sensor_request(), PacketType.PROBE_SENSORS),
+        ]
+        packets: dict[int, bytes] = {}
+        arrived = {packet_type: asyncio.Event() for _, packet_type in steps}
+        # Set by the first answer to FULL_DATA_Q: its ACK or SCHEDULE
+        full_data_answered = asyncio.Event()
+        if base is not None:
+            steps = [step for step in steps if step[1] != PacketType.DEVICE_STATE]
+
+        def handler(data: bytes) -> None:
+            if data[2] in (PacketType.ACK, PacketType.SCHEDULE):
+                full_data_answered.set()
+            event = arrived.get(data[2])
+            if event is not None:
+                packets[data[2]] = data
+                event.set()
+
+        async with self._notifications(), self._listen(handler):
+            if strategy == FetchStrategy.PIPELINED:
+                await self._write(build_full_data_request())
+                # PROBE_SENSORS is the last packet of the FULL_DATA response:
+                # once it is in, anything still missing was dropped.
+                try:
+                    await self._wait(
+                        arrived[PacketType.PROBE_SENSORS].wait(), timeout, "sensor"
+                    )
+                except TimeoutError:
+                    pass
+                if PacketType.SCHEDULE not in packets and self._client.is_connected:
+                    # SCHEDULE only comes with FULL_DATA: ask once more, and
+                    # wait for SCHEDULE itself rather than the ACK. The
+                    # repeat also answers any other request still missing.
+                    self.stats.retries += 1
+                    await self._write(build_full_data_request())
+                    try:
+                        await self._wait(
+                            arrived[PacketType.SCHEDULE].wait(), timeout, "schedule"
+                        )
+                    except TimeoutError:
+                        pass
+                steps = steps[1:]
+
             # Send each request and wait for its response before the next.
             # Some BLE proxies (e.g. ESPHome) drop notifications if multiple
             # commands are sent before their responses are consumed.
-            for cmd in [
-                build_full_data_request(),
-                build_status_request(),
-                build_sensor_request(),
-            ]:
+            # Steps whose packet already arrived (from any request) are skipped.
+            # The FULL_DATA_Q step ends on the ACK: proxies forward only that
+            # first notification, so SCHEDULE would never come. Over a direct
+            # link SCHEDULE still arrives while the next requests run.
+            for cmd, packet_type in steps:
+                if packet_type in packets:
+                    continue
                 if not self._client.is_connected:
                     break
-                new_packet.clear()
-                await self._client.write_gatt_char(
-                    self._command_char, cmd, response=True
+                await self._write(cmd)
+                event = (
+                    full_data_answered
+                    if packet_type == PacketType.SCHEDULE
+                    else arrived[packet_type]
                 )
                 try:
-                    await asyncio.wait_for(new_packet.wait(), timeout=timeout)
+                    await self._wait(
+                        event.wait(),
+                        timeout,
+                        _RESPONSE_NAMES[packet_type],
+                    )
                 except TimeoutError:
                     pass
 
-        finally:
-            await self._stop_notify()
+        status_data = packets.get(PacketType.DEVICE_STATE)
+        schedule_data = packets.get(PacketType.SCHEDULE)
+        probe_data = packets.get(PacketType.PROBE_SENSORS)
+
+        self.stats.timings["fetch"] = time.monotonic() - start
 
-        if not status_data:
+        if status_data:
+            status = parse_status(status_data)
+            if not status:
+                self.stats.invalid_responses += 1
+                raise ValueError("Invalid status response")
+        elif base is not None:
+            if not schedule_data and not probe_data:
+                raise TimeoutError("No sensor response received")
+            # Readings of a packet that didn't arrive are unknown, as without
+            # base, instead of carrying base's old readings forward
+            status = replace(base, **_NO_READINGS)
+        else:
             raise TimeoutError("No status response received")
 
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        # Remote temperature and humidity from SCHEDULE packet
-        if schedule_data:
-            remote_temp, remote_humidity = parse_schedule_data(schedule_data)
-            if remote_temp is not None:
-                status = replace(status, temp_remote=remote_temp)
-            if remote_humidity is not None:
-                status = replace(status, humidity_remote=remote_humidity)
-
-        # Probe sensor readings from PROBE_SENSORS packet
-        sensors = parse_sensors(probe_data) if probe_data else None
-        if sensors:
-            if sensors.temp_probe1 is not None:
-                status = replace(status, temp_probe1=sensors.temp_probe1)
-            if sensors.temp_probe2 is not None:
-                status = replace(status, temp_probe2=sensors.temp_probe2)
-            if sensors.humidity_probe1 is not None:
-                status = replace(status, humidity_probe1=sensors.humidity_probe1)
+        # Remote readings from SCHEDULE, probe readings from PROBE_SENSORS
+        remote_temp, remote_humidity = (
+            parse_schedule_data(schedule_data) if schedule_data else (None, None)
+        )
+        sensors = (parse_sensors(probe_data) if probe_data else None) or _NO_SENSORS
+        status = status.merged(
+            temp_remote=remote_temp,
+            humidity_remote=remote_humidity,
+            temp_probe1=sensors.temp_probe1,
+            temp_probe2=sensors.temp_probe2,
+            humidity_probe1=sensors.humidity_probe1,
+        )
 
-        self._last_status = status
+        if status_data:
+            self._set_last_status(status)
         return status
 
     async def set_airflow_mode(
         self,
         mode: str,
         timeout: float = 10.0,
+        force: bool = False,
     ) -> DeviceStatus:
         """Set airflow mode.
 
@@ -314,6 +712,7 @@ class VisionAirClient:
         Args:
             mode: Airflow mode ("low", "medium", or "high")
             timeout: How long to wait for response
+            force: Write even if last_status already shows this mode
 
         Returns:
             Updated DeviceStatus after change
@@ -327,12 +726,13 @@ class VisionAirClient:
             raise ValueError("Mode must be 'low', 'medium', or 'high'")
 
         airflow = {"low": AIRFLOW_LOW, "medium": AIRFLOW_MEDIUM, "high": AIRFLOW_HIGH}[mode]
-        return await self.set_airflow(airflow, timeout=timeout)
+        return await self.set_airflow(airflow, timeout=timeout, force=force)
 
     async def set_airflow(
         self,
         airflow: int,
         timeout: float = 10.0,
+        force: bool = False,
     ) -> DeviceStatus:
         """Set airflow level.
 
@@ -342,6 +742,7 @@ class VisionAirClient:
         Args:
             airflow: AirflowLevel.LOW (1), MEDIUM (2), or HIGH (3)
             timeout: How long to wait for response
+            force: Write even if last_status already shows this level
 
         Returns:
             Updated DeviceStatus after change
@@ -350,36 +751,12 @@ class VisionAirClient:
             ValueError: If airflow value is invalid
             TimeoutError: If no response received
         """
-        self._find_characteristics()
-
         packet = build_mode_select_request(airflow)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
+        if self._is_current("airflow_mode", _AIRFLOW_MODES[airflow], force):
+            return self._last_status
 
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        return await self._command(packet, timeout=timeout)
 
     async def set_airflow_low(self) -> DeviceStatus:
         """Set airflow to low level.
@@ -402,7 +779,12 @@ class VisionAirClient:
         """
         return await self.set_airflow_mode("high")
 
-    async def set_boost(self, enable: bool, timeout: float = 10.0) -> DeviceStatus:
+    async def set_boost(
+        self,
+        enable: bool,
+        timeout: float = 10.0,
+        force: bool = False,
+    ) -> DeviceStatus:
         """Enable or disable BOOST mode.
 
         BOOST mode runs the fan at maximum for 30 minutes, then auto-deactivates.
@@ -411,42 +793,24 @@ class VisionAirClient:
         Args:
             enable: True to enable BOOST, False to disable
             timeout: How long to wait for response
+            force: Write even if last_status already shows this state
 
         Returns:
             Updated DeviceStatus after change
         """
-        self._find_characteristics()
-
         packet = build_boost_command(enable)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
+        if self._is_current("boost_active", enable, force):
+            return self._last_status
 
-        self._last_status = status
-        return status
+        return await self._command(packet, timeout=timeout)
 
-    async def set_holiday(self, days: int, timeout: float = 10.0) -> DeviceStatus:
+    async def set_holiday(
+        self,
+        days: int,
+        timeout: float = 10.0,
+        force: bool = False,
+    ) -> DeviceStatus:
         """Set holiday mode duration.
 
         Holiday mode puts the device in a low-power state for the specified
@@ -457,6 +821,7 @@ class VisionAirClient:
         Args:
             days: Number of holiday days (0=OFF, 1-255=active)
             timeout: How long to wait for response
+            force: Write even if last_status already shows this value
 
         Returns:
             Updated DeviceStatus after change
@@ -465,36 +830,12 @@ class VisionAirClient:
             ValueError: If days is not in range 0-255
             TimeoutError: If no response within timeout
         """
-        self._find_characteristics()
-
         packet = build_holiday_command(days)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
+        if self._is_current("holiday_days", days, force):
+            return self._last_status
 
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        return await self._command(packet, timeout=timeout)
 
     async def clear_holiday(self, timeout: float = 10.0) -> DeviceStatus:
         """Disable holiday mode.
@@ -513,6 +854,7 @@ class VisionAirClient:
         self,
         enabled: bool,
         timeout: float = 10.0,
+        force: bool = False,
     ) -> DeviceStatus:
         """Enable or disable winter preheat.
 
@@ -522,45 +864,23 @@ class VisionAirClient:
         Args:
             enabled: Whether to enable preheat
             timeout: How long to wait for response
+            force: Write even if last_status already shows this state
 
         Returns:
             Updated DeviceStatus
         """
-        self._find_characteristics()
-
         packet = build_preheat_request(enabled)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
+        if self._is_current("preheat_enabled", enabled, force):
+            return self._last_status
 
-        self._last_status = status
-        return status
+        return await self._command(packet, timeout=timeout)
 
     async def set_preheat_temperature(
         self,
         temperature: int,
         timeout: float = 10.0,
+        force: bool = False,
     ) -> DeviceStatus:
         """Set the preheat temperature.
 
@@ -569,6 +889,7 @@ class VisionAirClient:
         Args:
             temperature: Target temperature in °C (12-18)
             timeout: How long to wait for response
+            force: Write even if last_status already shows this value
 
         Returns:
             Updated DeviceStatus
@@ -576,55 +897,39 @@ class VisionAirClient:
         Raises:
             ValueError: If temperature is outside 12-18 range
         """
-        self._find_characteristics()
-
         packet = build_preheat_temp_request(temperature)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
+        if self._is_current("preheat_temp", temperature, force):
+            return self._last_status
 
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
+        status = await self._command(packet, timeout=timeout)
 
         # Optimistic update: DEVICE_STATE doesn't immediately reflect the new
         # preheat temperature (byte 56 stays stale), but the command is applied
         # (verified against VMI+ app). Apply the requested value so callers
         # see the correct state.
-        from dataclasses import replace
-
-        status = replace(status, preheat_temp=temperature)
-        self._last_status = status
+        status = status.merged(preheat_temp=temperature)
+        self._set_last_status(status)
         return status
 
-    async def set_summer_limit(self, enabled: bool, timeout: float = 10.0) -> DeviceStatus:
+    async def set_summer_limit(
+        self,
+        enabled: bool,
+        timeout: float = 10.0,
+        force: bool = False,
+    ) -> DeviceStatus:
         """Enable or disable summer limit.
 
         Args:
             enabled: Whether to enable summer limit
             timeout: How long to wait for acknowledgment
+            force: Write even if last_status already shows this state
 
         Returns:
             Updated DeviceStatus
         """
-        self._find_characteristics()
+        if self._is_current("summer_limit_enabled", enabled, force):
+            return self._last_status
 
         if self._last_status is None:
             await self.get_status()
@@ -638,30 +943,17 @@ class VisionAirClient:
 
         packet = build_sync_packet(enabled, temp, airflow)
 
-        status_data: bytes | None = None
-        ack_received = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC:
-                if data[2] == PacketType.DEVICE_STATE:
-                    status_data = bytes(data)
-                    ack_received.set()
-                elif data[2] == PacketType.ACK:
-                    ack_received.set()
+        response = await self._transact(
+            packet,
+            (PacketType.DEVICE_STATE, PacketType.ACK),
+            _raw,
+            timeout=timeout,
+        )
 
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(ack_received.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if status_data:
-            status = parse_status(status_data)
+        if response[2] == PacketType.DEVICE_STATE:
+            status = parse_status(response)
             if status:
-                self._last_status = status
+                self._set_last_status(status)
                 return status
 
         await asyncio.sleep(0.5)
@@ -682,35 +974,12 @@ class VisionAirClient:
         Raises:
             TimeoutError: If no SCHEDULE_CONFIG response within timeout
         """
-        self._find_characteristics()
-
-        config_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal config_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.SCHEDULE_CONFIG:
-                config_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_schedule_config_request(), response=True
-            )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not config_data:
-            raise TimeoutError("No schedule config response received")
-
-        config = parse_schedule_config(config_data)
-        if not config:
-            raise ValueError("Invalid schedule config response")
-
-        return config
+        return await self._transact(
+            build_schedule_config_request(),
+            (PacketType.SCHEDULE_CONFIG,),
+            parse_schedule_config,
+            timeout=timeout,
+        )
 
     async def set_schedule(
         self,
@@ -731,25 +1000,83 @@ class VisionAirClient:
             ValueError: If config is invalid
             TimeoutError: If no acknowledgment received
         """
-        self._find_characteristics()
-
         packet = build_schedule_write(config)
 
-        ack_received = asyncio.Event()
+        await self._transact(packet, (PacketType.ACK,), _raw, timeout=timeout)
 
-        def handler(*args: Any) -> None:
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.ACK:
-                ack_received.set()
+    async def apply(
+        self,
+        changes: Mapping[str, Any],
+        *,
+        base: DeviceStatus | None = None,
+        timeout: float = 10.0,
+        force: bool = False,
+    ) -> DeviceStatus:
+        """Apply several settings at once, writing only those that differ.
 
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, packet, response=True
-            )
-            await asyncio.wait_for(ack_received.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
+        The requested values are compared against base, or else against
+        last_status (fetched first if there is none or it is older than
+        status_max_age), and only the settings that differ are written, in
+        APPLY_SETTINGS order, within one notification subscription.
+
+        Args:
+            changes: Mapping of setting to value. Keys: "airflow_mode"
+                ("low"/"medium"/"high"), "preheat" (bool),
+                "preheat_temperature" (12-18), "summer_limit" (bool),
+                "holiday_days" (0-255), "boost" (bool)
+            base: Status known to be current, e.g. kept up to date from
+                push updates, to compare against instead of fetching one
+            timeout: How long to wait for each response
+            force: Write every requested setting, even unchanged ones
+
+        Returns:
+            DeviceStatus after the last write
+
+        Raises:
+            ValueError: If a setting is unknown or a value is invalid
+            TimeoutError: If a response is not received
+        """
+        unknown = set(changes) - set(APPLY_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown settings: {', '.join(sorted(unknown))}")
+        changes = dict(changes)
+        if "airflow_mode" in changes:
+            mode = changes["airflow_mode"]
+            if not isinstance(mode, str):
+                raise ValueError("Mode must be 'low', 'medium', or 'high'")
+            changes["airflow_mode"] = mode.lower()
+        if base is not None and not force and all(
+            getattr(base, APPLY_SETTINGS[key][0]) == value for key, value in changes.items()
+        ):
+            return base
+
+        async with self._notifications():
+            current = base
+            if current is None and not force:
+                age = self._status_age()
+                if age is None or age > self.status_max_age:
+                    await self.get_status(timeout=timeout)
+                current = self._last_status
+
+            for key, (field_name, setter) in APPLY_SETTINGS.items():
+                if key not in changes:
+                    continue
+                value = changes[key]
+                if not force and getattr(current, field_name) == value:
+                    continue
+                await getattr(self, setter)(value, timeout=timeout, force=True)
+                current = self._last_status
+
+            status = current
+            if status is None:
+                # Forced apply with nothing to write
+                status = await self.get_status(timeout=timeout)
+        if "preheat_temperature" in changes and status.preheat_temp != changes["preheat_temperature"]:
+            # A later DEVICE_STATE still carries the stale preheat byte; keep
+            # the optimistic value (see set_preheat_temperature)
+            status = status.merged(preheat_temp=changes["preheat_temperature"])
+            self._set_last_status(status)
+        return status
 
     @property
     def last_status(self) -> DeviceStatus | None:
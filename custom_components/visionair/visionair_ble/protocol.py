@@ -38,9 +38,13 @@ DEVICE_STATE bytes 35/42 are unreliable for probe readings.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, fields
 from enum import IntEnum
-from typing import NamedTuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, NamedTuple
 
 
 def sensor(
@@ -52,6 +56,8 @@ def sensor(
     enabled_default: bool = True,
     options: list[str] | None = None,
     precision: int | None = None,
+    deadband: float | None = None,
+    min_interval: float | None = None,
 ) -> dict:
     """Create field metadata for a sensor.
 
@@ -63,6 +69,10 @@ def sensor(
         enabled_default: Whether sensor is enabled by default
         options: Valid options for enum sensors
         precision: Suggested display precision (decimal places)
+        deadband: Changes of at most this much from the last published value
+            are held back, so read jitter doesn't produce state changes
+        min_interval: Seconds after which a change held back by the deadband
+            is published anyway
     """
     meta = {
         "sensor": True,
@@ -80,9 +90,50 @@ def sensor(
         meta["device_class"] = "enum"
     if precision is not None:
         meta["precision"] = precision
+    if deadband is not None:
+        meta["deadband"] = deadband
+    if min_interval is not None:
+        meta["min_interval"] = min_interval
     return meta
 
 
+class SensorDescriptor(NamedTuple):
+    """A sensor field, compiled from its sensor() metadata."""
+
+    key: str  # Field name, also the HA translation key
+    name: str
+    unit: str | None
+    device_class: str | None
+    state_class: str | None
+    enabled_default: bool
+    options: list[str] | None
+    precision: int | None
+    deadband: float | None
+    min_interval: float | None
+    getter: Callable[[Any], Any]  # Reads the field from an instance
+
+
+def _compile_sensors(cls: type) -> tuple[SensorDescriptor, ...]:
+    """Collect the sensor fields of a dataclass, in declaration order."""
+    return tuple(
+        SensorDescriptor(
+            key=f.name,
+            name=f.metadata["name"],
+            unit=f.metadata.get("unit"),
+            device_class=f.metadata.get("device_class"),
+            state_class=f.metadata.get("state_class"),
+            enabled_default=f.metadata["enabled_default"],
+            options=f.metadata.get("options"),
+            precision=f.metadata.get("precision"),
+            deadband=f.metadata.get("deadband"),
+            min_interval=f.metadata.get("min_interval"),
+            getter=attrgetter(f.name),
+        )
+        for f in fields(cls)
+        if f.metadata.get("sensor")
+    )
+
+
 def format_sensors(data: "DeviceStatus | SensorData", enabled_only: bool = True) -> str:
     """Format sensor data for display using field metadata.
 
@@ -93,23 +144,15 @@ def format_sensors(data: "DeviceStatus | SensorData", enabled_only: bool = True)
     Returns:
         Formatted string with sensor names, values, and units
     """
-    import dataclasses
-
     lines = []
-    for f in dataclasses.fields(data):
-        meta = f.metadata
-        if not meta.get("sensor"):
-            continue
-        if enabled_only and not meta.get("enabled_default", True):
+    for desc in SENSORS[type(data)]:
+        if enabled_only and not desc.enabled_default:
             continue
 
-        value = getattr(data, f.name)
+        value = desc.getter(data)
         if value is None:
             continue
 
-        name = meta.get("name", f.name)
-        unit = meta.get("unit", "")
-
         # Format value
         if isinstance(value, float):
             formatted = f"{value:.1f}"
@@ -118,10 +161,10 @@ def format_sensors(data: "DeviceStatus | SensorData", enabled_only: bool = True)
         else:
             formatted = str(value)
 
-        if unit:
-            lines.append(f"{name}: {formatted} {unit}")
+        if desc.unit:
+            lines.append(f"{desc.name}: {formatted} {desc.unit}")
         else:
-            lines.append(f"{name}: {formatted}")
+            lines.append(f"{desc.name}: {formatted}")
 
     return "\n".join(lines)
 
@@ -340,6 +383,16 @@ MODE_NAMES: dict[int, str] = {
     2: "High",
 }
 
+# Publishing filters for sensor readings, which are whole degrees and
+# percent. Readings near a step boundary flip by one unit between reads, so
+# a one-step change is published once the last published value is
+# READING_MIN_INTERVAL old, and is dropped if the reading flips back before
+# then. Changes of two steps or more are published right away. Airflow is
+# derived from the selected mode, not measured, and is not filtered.
+TEMPERATURE_DEADBAND = 1  # °C
+HUMIDITY_DEADBAND = 1  # %
+READING_MIN_INTERVAL = 900  # seconds
+
 
 class AirflowBytes(NamedTuple):
     """Two-byte pair for SYNC packets (semantics unverified)."""
@@ -348,7 +401,7 @@ class AirflowBytes(NamedTuple):
     byte2: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceStatus:
     """Device state from DEVICE_STATE packet (type 0x01).
 
@@ -356,6 +409,7 @@ class DeviceStatus:
     For reliable probe temperatures, use SensorData from PROBE_SENSORS packet.
 
     Fields with sensor metadata will be auto-discovered by the HA integration.
+    Instances are immutable; use merged() to derive an updated status.
     """
 
     # Internal fields (no sensor metadata)
@@ -374,21 +428,26 @@ class DeviceStatus:
 
     # Sensors - temperatures
     temp_remote: int | None = field(default=None, metadata=sensor(
-        "Room temperature", unit="°C", device_class="temperature", precision=0
+        "Room temperature", unit="°C", device_class="temperature", precision=0,
+        deadband=TEMPERATURE_DEADBAND, min_interval=READING_MIN_INTERVAL,
     ))
     temp_probe1: int | None = field(default=None, metadata=sensor(
-        "Outlet temperature", unit="°C", device_class="temperature", precision=0
+        "Outlet temperature", unit="°C", device_class="temperature", precision=0,
+        deadband=TEMPERATURE_DEADBAND, min_interval=READING_MIN_INTERVAL,
     ))
     temp_probe2: int | None = field(default=None, metadata=sensor(
-        "Inlet temperature", unit="°C", device_class="temperature", precision=0
+        "Inlet temperature", unit="°C", device_class="temperature", precision=0,
+        deadband=TEMPERATURE_DEADBAND, min_interval=READING_MIN_INTERVAL,
     ))
 
     # Sensors - humidity
     humidity_remote: float | None = field(default=None, metadata=sensor(
-        "Room humidity", unit="%", device_class="humidity", precision=0
+        "Room humidity", unit="%", device_class="humidity", precision=0,
+        deadband=HUMIDITY_DEADBAND, min_interval=READING_MIN_INTERVAL,
     ))
     humidity_probe1: int | None = field(default=None, metadata=sensor(
-        "Outlet humidity", unit="%", device_class="humidity", precision=0
+        "Outlet humidity", unit="%", device_class="humidity", precision=0,
+        deadband=HUMIDITY_DEADBAND, min_interval=READING_MIN_INTERVAL,
     ))
 
     # Sensors - equipment life
@@ -407,9 +466,35 @@ class DeviceStatus:
     boost_active: bool = False
     holiday_days: int = 0
 
+    def merged(self, **readings: int | None) -> DeviceStatus:
+        """Return a copy with readings from other packets applied.
+
+        Readings that are None are skipped, so a missing value never
+        overwrites a known one. All readings are applied in one construction
+        instead of one copy per field.
+
+        Args:
+            **readings: Field names and values, e.g. temp_remote=21
+
+        Returns:
+            The new status, or self if no reading was given
+
+        Raises:
+            TypeError: If a name is not a DeviceStatus field
+        """
+        values = {name: value for name, value in readings.items() if value is not None}
+        if not values:
+            return self
+        for name in _DEVICE_STATUS_FIELDS:
+            if name not in values:
+                values[name] = getattr(self, name)
+        return DeviceStatus(**values)
+
+
+_DEVICE_STATUS_FIELDS: tuple[str, ...] = tuple(DeviceStatus.__dataclass_fields__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorData:
     """Probe sensor data from PROBE_SENSORS packet (type 0x03).
 
@@ -431,12 +516,21 @@ class SensorData:
     ))
 
 
-@dataclass
+# Sensor fields of each data class, compiled once at import
+DEVICE_STATUS_SENSORS: tuple[SensorDescriptor, ...] = _compile_sensors(DeviceStatus)
+SENSOR_DATA_SENSORS: tuple[SensorDescriptor, ...] = _compile_sensors(SensorData)
+SENSORS: dict[type, tuple[SensorDescriptor, ...]] = {
+    DeviceStatus: DEVICE_STATUS_SENSORS,
+    SensorData: SENSOR_DATA_SENSORS,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ScheduleSlot:
     """A single hourly schedule slot.
 
     Each slot defines the preheat temperature and airflow mode for one hour
-    of the day (0-23). The hour is implied by position in the ScheduleConfig.slots list.
+    of the day (0-23). The hour is implied by position in ScheduleConfig.
 
     The mode_byte field stores the raw protocol byte for round-trip fidelity:
     a schedule read from the device can be written back unchanged, even if it
@@ -474,15 +568,91 @@ class ScheduleSlot:
         return cls(preheat_temp=preheat_temp, mode_byte=SCHEDULE_MODE_BYTES[airflow])
 
 
-@dataclass
 class ScheduleConfig:
     """Full 24-hour schedule configuration.
 
     Contains 24 hourly slots where index = hour (0-23).
     Each slot defines the preheat temperature and airflow mode for that hour.
+
+    The schedule is stored as the 48 slot bytes of the protocol (preheat
+    temperature, mode byte per hour) and is immutable; slots are built on
+    access. Use with_slot() to derive a changed schedule.
     """
 
-    slots: list[ScheduleSlot]  # Exactly 24 slots, index = hour (0-23)
+    __slots__ = ("data",)
+
+    data: bytes
+
+    def __init__(
+        self,
+        slots: Iterable[ScheduleSlot] | None = None,
+        *,
+        data: bytes | None = None,
+    ) -> None:
+        """Create a schedule from slots or from raw slot bytes.
+
+        Args:
+            slots: Hourly slots, index = hour (0-23)
+            data: Raw slot bytes as sent by the device (2 bytes per slot)
+        """
+        if data is None:
+            data = bytes(
+                value
+                for slot in slots or ()
+                for value in (slot.preheat_temp, slot.mode_byte)
+            )
+        object.__setattr__(self, "data", bytes(data))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def slots(self) -> tuple[ScheduleSlot, ...]:
+        """All slots, index = hour (0-23)."""
+        data = self.data
+        return tuple(
+            ScheduleSlot(preheat_temp=data[i], mode_byte=data[i + 1])
+            for i in range(0, len(data) - 1, 2)
+        )
+
+    def __len__(self) -> int:
+        return len(self.data) // 2
+
+    def __getitem__(self, hour: int) -> ScheduleSlot:
+        if not -len(self) <= hour < len(self):
+            raise IndexError(f"Schedule has no slot {hour}")
+        offset = (hour % len(self)) * 2
+        return ScheduleSlot(
+            preheat_temp=self.data[offset], mode_byte=self.data[offset + 1]
+        )
+
+    def __iter__(self) -> Iterator[ScheduleSlot]:
+        return iter(self.slots)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScheduleConfig):
+            return NotImplemented
+        return self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"ScheduleConfig(slots={list(self.slots)!r})"
+
+    def with_slot(self, hour: int, slot: ScheduleSlot) -> ScheduleConfig:
+        """Return a copy of the schedule with one hour replaced.
+
+        Args:
+            hour: Hour of the day (0-23)
+            slot: New slot for that hour
+        """
+        if not 0 <= hour < len(self):
+            raise IndexError(f"Schedule has no slot {hour}")
+        data = bytearray(self.data)
+        data[hour * 2] = slot.preheat_temp
+        data[hour * 2 + 1] = slot.mode_byte
+        return ScheduleConfig(data=data)
 
 
 def calc_checksum(data: bytes) -> int:
@@ -516,9 +686,14 @@ def verify_checksum(packet: bytes) -> bool:
     return calculated == expected
 
 
+@lru_cache(maxsize=None)
 def build_request(param: int, value: int = 0, extended: bool = False) -> bytes:
     """Build a standard request packet (type 0x10).
 
+    Packets are memoized: there are only a few params and small value
+    ranges, so each distinct packet is encoded once and the same immutable
+    bytes object is returned afterwards.
+
     Args:
         param: Request parameter (from RequestParam class)
         value: Optional value byte (default 0)
@@ -594,6 +769,14 @@ def build_full_data_request() -> bytes:
     return build_request(RequestParam.FULL_DATA, extended=True)
 
 
+# AirflowLevel -> REQUEST param 0x18 value
+_MODE_SELECT_VALUES: dict[int, int] = {
+    AirflowLevel.LOW: 0,
+    AirflowLevel.MEDIUM: 1,
+    AirflowLevel.HIGH: 2,
+}
+
+
 def build_mode_select_request(mode: int) -> bytes:
     """Build a mode select command packet (REQUEST param 0x18).
 
@@ -610,17 +793,12 @@ def build_mode_select_request(mode: int) -> bytes:
     Raises:
         ValueError: If mode is not a valid AirflowLevel
     """
-    mode_values = {
-        AirflowLevel.LOW: 0,
-        AirflowLevel.MEDIUM: 1,
-        AirflowLevel.HIGH: 2,
-    }
-    if mode not in mode_values:
+    if mode not in _MODE_SELECT_VALUES:
         raise ValueError(
             f"Mode must be AirflowLevel.LOW ({AirflowLevel.LOW}), "
             f"MEDIUM ({AirflowLevel.MEDIUM}), or HIGH ({AirflowLevel.HIGH})"
         )
-    return build_request(RequestParam.MODE_SELECT, value=mode_values[mode], extended=True)
+    return build_request(RequestParam.MODE_SELECT, value=_MODE_SELECT_VALUES[mode], extended=True)
 
 
 def build_boost_command(enable: bool) -> bytes:
@@ -823,21 +1001,18 @@ def build_schedule_write(config: ScheduleConfig) -> bytes:
     Raises:
         ValueError: If config does not have exactly 24 slots
     """
-    if len(config.slots) != 24:
+    if len(config.data) != 48:
         raise ValueError(
-            f"Schedule must have exactly 24 slots, got {len(config.slots)}"
+            f"Schedule must have exactly 24 slots, got {len(config)}"
         )
 
-    payload = bytearray([PacketType.SCHEDULE_WRITE, 0x06, 0x31, 0x00])
-
-    for slot in config.slots:
-        payload.append(slot.preheat_temp)
-        payload.append(slot.mode_byte)
+    payload = bytes([PacketType.SCHEDULE_WRITE, 0x06, 0x31, 0x00]) + config.data
 
-    checksum = calc_checksum(bytes(payload))
-    return MAGIC + bytes(payload) + bytes([checksum])
+    checksum = calc_checksum(payload)
+    return MAGIC + payload + bytes([checksum])
 
 
+@lru_cache(maxsize=None)
 def build_sync_packet(
     summer_limit_enabled: bool,
     preheat_temp: int,
@@ -891,6 +1066,82 @@ def build_sync_packet(
     return MAGIC + payload + bytes([checksum])
 
 
+# =============================================================================
+# Packet Layouts
+# =============================================================================
+#
+# Each layout lists (field, offset, struct format) in offset order and is
+# compiled once into a little-endian struct.Struct. Parsers unpack all fields
+# in one call straight from the notification buffer (bytes, bytearray or
+# memoryview), without slicing or copying.
+
+_MAGIC_0, _MAGIC_1 = MAGIC
+
+
+def _compile_layout(layout: tuple[tuple[str, int, str], ...]) -> struct.Struct:
+    """Compile a field layout into a Struct unpacking the fields in order.
+
+    Raises:
+        ValueError: If the fields are not in offset order or overlap
+    """
+    fmt = "<"
+    position = 0
+    for name, offset, code in layout:
+        if offset < position:
+            raise ValueError(f"Field {name} at {offset} overlaps the previous field")
+        if offset > position:
+            fmt += f"{offset - position}x"
+        fmt += code
+        position = offset + struct.calcsize(code)
+    return struct.Struct(fmt)
+
+
+_DEVICE_STATE_LAYOUT = _compile_layout((
+    ("device_id_low", DeviceStateOffset.UNKNOWN_5_7, "H"),
+    ("device_id_high", DeviceStateOffset.UNKNOWN_5_7 + 2, "B"),
+    ("configured_volume", DeviceStateOffset.CONFIGURED_VOLUME, "H"),
+    ("operating_days", DeviceStateOffset.OPERATING_DAYS, "H"),
+    ("filter_days", DeviceStateOffset.FILTER_DAYS, "H"),
+    ("mode_selector", DeviceStateOffset.MODE_SELECTOR, "B"),
+    ("summer_limit_temp", DeviceStateOffset.SUMMER_LIMIT_TEMP, "B"),
+    ("holiday_days", DeviceStateOffset.HOLIDAY_DAYS, "B"),
+    ("boost_active", DeviceStateOffset.BOOST_ACTIVE, "B"),
+    ("airflow_indicator", DeviceStateOffset.AIRFLOW_INDICATOR, "B"),
+    ("summer_limit_enabled", DeviceStateOffset.SUMMER_LIMIT_ENABLED, "B"),
+    ("preheat_enabled", DeviceStateOffset.PREHEAT_ENABLED, "B"),
+    ("preheat_temp", DeviceStateOffset.PREHEAT_TEMP, "B"),
+))
+
+_PROBE_SENSORS_LAYOUT = _compile_layout((
+    ("temp_probe1", ProbeSensorOffset.TEMP_PROBE1, "B"),
+    ("humidity_probe1", ProbeSensorOffset.HUMIDITY_PROBE1, "B"),
+    ("temp_probe2", ProbeSensorOffset.TEMP_PROBE2, "B"),
+    ("filter_percent", ProbeSensorOffset.FILTER_PERCENT, "B"),
+))
+
+_SCHEDULE_DATA_LAYOUT = _compile_layout((
+    ("remote_temp", ScheduleDataOffset.REMOTE_TEMP, "B"),
+    ("remote_humidity", ScheduleDataOffset.REMOTE_HUMIDITY, "B"),
+))
+
+# Airflow indicator -> (mode name, ACH rate applied to the configured volume)
+_AIRFLOW_RATES: dict[int, tuple[str, float]] = {
+    AirflowIndicator.LOW: ("low", 0.36),
+    AirflowIndicator.MEDIUM: ("medium", 0.45),
+    AirflowIndicator.HIGH: ("high", 0.55),
+}
+
+
+def _has_header(data: bytes, packet_type: int, min_length: int) -> bool:
+    """Check length, magic bytes and packet type without slicing."""
+    return (
+        len(data) >= min_length
+        and data[0] == _MAGIC_0
+        and data[1] == _MAGIC_1
+        and data[2] == packet_type
+    )
+
+
 def parse_status(data: bytes) -> DeviceStatus | None:
     """Parse device state packet (type 0x01).
 
@@ -900,56 +1151,42 @@ def parse_status(data: bytes) -> DeviceStatus | None:
     Returns:
         DeviceStatus object or None if packet is invalid
     """
-    if len(data) < 61 or data[:2] != MAGIC or data[DeviceStateOffset.TYPE] != PacketType.DEVICE_STATE:
+    if not _has_header(data, PacketType.DEVICE_STATE, 61):
         return None
 
-    airflow_indicator = data[DeviceStateOffset.AIRFLOW_INDICATOR]
-    mode_selector = data[DeviceStateOffset.MODE_SELECTOR]
-    mode_name = MODE_NAMES.get(mode_selector, f"Unknown ({mode_selector})")
+    (
+        device_id_low,
+        device_id_high,
+        configured_volume,
+        operating_days,
+        filter_days,
+        mode_selector,
+        summer_limit_temp,
+        holiday_days,
+        boost_active,
+        airflow_indicator,
+        summer_limit_enabled,
+        preheat_enabled,
+        preheat_temp,
+    ) = _DEVICE_STATE_LAYOUT.unpack_from(data)
 
-    # Configured volume from bytes 22-23 (little-endian uint16)
-    configured_volume = None
+    # Calculate actual airflow values based on volume and ACH rates
     airflow_low = None
     airflow_medium = None
     airflow_high = None
-    if len(data) >= DeviceStateOffset.CONFIGURED_VOLUME + 2:
-        configured_volume = int.from_bytes(
-            data[DeviceStateOffset.CONFIGURED_VOLUME:DeviceStateOffset.CONFIGURED_VOLUME + 2], "little"
-        )
-        if configured_volume > 0:
-            # Calculate actual airflow values based on volume and ACH rates
-            airflow_low = round(configured_volume * 0.36)
-            airflow_medium = round(configured_volume * 0.45)
-            airflow_high = round(configured_volume * 0.55)
+    if configured_volume > 0:
+        airflow_low = round(configured_volume * 0.36)
+        airflow_medium = round(configured_volume * 0.45)
+        airflow_high = round(configured_volume * 0.55)
 
     # Determine current airflow mode and value from indicator
     # airflow is 0 if configured_volume is unavailable (we can't calculate m³/h)
-    airflow_mode = "unknown"
-    airflow = 0
-    if airflow_indicator == AirflowIndicator.LOW:
-        airflow_mode = "low"
-        airflow = airflow_low or 0
-    elif airflow_indicator == AirflowIndicator.MEDIUM:
-        airflow_mode = "medium"
-        airflow = airflow_medium or 0
-    elif airflow_indicator == AirflowIndicator.HIGH:
-        airflow_mode = "high"
-        airflow = airflow_high or 0
-
-    # Equipment life fields (little-endian uint16)
-    filter_days = None
-    operating_days = None
-    if len(data) >= DeviceStateOffset.FILTER_DAYS + 2:
-        filter_days = int.from_bytes(
-            data[DeviceStateOffset.FILTER_DAYS:DeviceStateOffset.FILTER_DAYS + 2], "little"
-        )
-        operating_days = int.from_bytes(
-            data[DeviceStateOffset.OPERATING_DAYS:DeviceStateOffset.OPERATING_DAYS + 2], "little"
-        )
+    airflow_mode, rate = _AIRFLOW_RATES.get(airflow_indicator, ("unknown", 0.0))
+    airflow = round(configured_volume * rate)
 
     return DeviceStatus(
         # Bytes 5-7 are constant per device, use as pseudo-identifier (3 bytes, LE)
-        device_id=int.from_bytes(data[DeviceStateOffset.UNKNOWN_5_7:DeviceStateOffset.UNKNOWN_5_7 + 3], "little"),
+        device_id=device_id_low | device_id_high << 16,
         configured_volume=configured_volume,
         airflow=airflow,
         airflow_low=airflow_low,
@@ -957,14 +1194,14 @@ def parse_status(data: bytes) -> DeviceStatus | None:
         airflow_high=airflow_high,
         airflow_indicator=airflow_indicator,
         airflow_mode=airflow_mode,
-        preheat_enabled=data[DeviceStateOffset.PREHEAT_ENABLED] != 0x00,
-        summer_limit_enabled=data[DeviceStateOffset.SUMMER_LIMIT_ENABLED] != 0x00,
-        summer_limit_temp=data[DeviceStateOffset.SUMMER_LIMIT_TEMP] if len(data) > DeviceStateOffset.SUMMER_LIMIT_TEMP else None,
-        preheat_temp=data[DeviceStateOffset.PREHEAT_TEMP],
-        holiday_days=data[DeviceStateOffset.HOLIDAY_DAYS] if len(data) > DeviceStateOffset.HOLIDAY_DAYS else 0,
-        boost_active=data[DeviceStateOffset.BOOST_ACTIVE] == 0x01 if len(data) > DeviceStateOffset.BOOST_ACTIVE else False,
+        preheat_enabled=preheat_enabled != 0x00,
+        summer_limit_enabled=summer_limit_enabled != 0x00,
+        summer_limit_temp=summer_limit_temp,
+        preheat_temp=preheat_temp,
+        holiday_days=holiday_days,
+        boost_active=boost_active == 0x01,
         mode_selector=mode_selector,
-        mode_name=mode_name,
+        mode_name=MODE_NAMES.get(mode_selector, f"Unknown ({mode_selector})"),
         # Remote temperature is in the SCHEDULE packet (type 0x02), not here.
         # Use parse_schedule_data() on the SCHEDULE response to get temp_remote.
         # Probe temperatures: use get_sensors() / PROBE_SENSORS packet.
@@ -988,14 +1225,17 @@ def parse_sensors(data: bytes) -> SensorData | None:
     Returns:
         SensorData object or None if packet is invalid
     """
-    if len(data) < 14 or data[:2] != MAGIC or data[ProbeSensorOffset.TYPE] != PacketType.PROBE_SENSORS:
+    if not _has_header(data, PacketType.PROBE_SENSORS, 14):
         return None
 
+    temp_probe1, humidity_probe1, temp_probe2, filter_percent = (
+        _PROBE_SENSORS_LAYOUT.unpack_from(data)
+    )
     return SensorData(
-        temp_probe1=data[ProbeSensorOffset.TEMP_PROBE1] if len(data) > ProbeSensorOffset.TEMP_PROBE1 else None,
-        temp_probe2=data[ProbeSensorOffset.TEMP_PROBE2] if len(data) > ProbeSensorOffset.TEMP_PROBE2 else None,
-        humidity_probe1=data[ProbeSensorOffset.HUMIDITY_PROBE1] if len(data) > ProbeSensorOffset.HUMIDITY_PROBE1 else None,
-        filter_percent=data[ProbeSensorOffset.FILTER_PERCENT] if len(data) > ProbeSensorOffset.FILTER_PERCENT else None,
+        temp_probe1=temp_probe1,
+        temp_probe2=temp_probe2,
+        humidity_probe1=humidity_probe1,
+        filter_percent=filter_percent,
     )
 
 
@@ -1011,11 +1251,10 @@ def parse_schedule_data(data: bytes) -> tuple[int | None, int | None]:
     Returns:
         Tuple of (remote_temp, remote_humidity), either may be None if invalid
     """
-    if len(data) < 14 or data[:2] != MAGIC or data[ScheduleDataOffset.TYPE] != PacketType.SCHEDULE:
+    if not _has_header(data, PacketType.SCHEDULE, 14):
         return (None, None)
 
-    temp = data[ScheduleDataOffset.REMOTE_TEMP]
-    humidity = data[ScheduleDataOffset.REMOTE_HUMIDITY]
+    temp, humidity = _SCHEDULE_DATA_LAYOUT.unpack_from(data)
 
     # Sanity check: 0 or 255 likely means no data
     if temp == 0 or temp == 255:
@@ -1043,12 +1282,7 @@ def parse_schedule_config(data: bytes) -> ScheduleConfig | None:
     if data[3:6] != bytes([0x06, 0x31, 0x00]):
         return None
 
-    slots = []
-    for i in range(24):
-        offset = 6 + (i * 2)
-        slots.append(ScheduleSlot(preheat_temp=data[offset], mode_byte=data[offset + 1]))
-
-    return ScheduleConfig(slots=slots)
+    return ScheduleConfig(data=data[6:54])
 
 
 def is_visionair_device(address: str, name: str | None) -> bool:
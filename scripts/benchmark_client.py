@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Benchmark VisionAirClient request flows against the simulated device.
+
+Measures per-operation latency (p50/p95/p99), GATT calls per operation,
+command burst throughput and per-packet parser cost, and prints the results
+as JSON. No hardware or Home Assistant is needed; only bleak has to be
+installed.
+
+Usage (from the repo root):
+    python scripts/benchmark_client.py
+    python scripts/benchmark_client.py --proxy --latency 0.08 --jitter 0.03
+    python scripts/benchmark_client.py --keep-alive --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import timeit
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "custom_components" / "visionair"))
+
+from visionair_ble import (  # noqa: E402
+    FetchStrategy,
+    VisionAirClient,
+    parse_schedule_data,
+    parse_sensors,
+    parse_status,
+)
+from visionair_simulator import SimulatedBleakClient, SimulatedDevice  # noqa: E402
+
+GATT_CALLS = ("write", "start_notify", "stop_notify", "notify", "dropped")
+AIRFLOW_MODES = ("low", "medium", "high")
+
+# A p50 above this share of --timeout means requests mostly end by timing
+# out instead of by a response
+TIMEOUT_WARN_RATIO = 0.5
+
+
+def percentiles(samples: list[float]) -> dict[str, float | None]:
+    """Return p50/p95/p99 and mean of latency samples in milliseconds."""
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None, "mean": None}
+    ms = [s * 1000 for s in samples]
+    if len(ms) == 1:
+        cuts = ms * 99
+    else:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49], 3),
+        "p95": round(cuts[94], 3),
+        "p99": round(cuts[98], 3),
+        "mean": round(statistics.fmean(ms), 3),
+    }
+
+
+async def measure(
+    client: SimulatedBleakClient,
+    operation: Callable[[int], Awaitable[Any]],
+    iterations: int,
+) -> dict[str, Any]:
+    """Run an operation repeatedly and collect latency and GATT call counts."""
+    samples: list[float] = []
+    errors = 0
+    before = Counter(client.calls)
+    for i in range(iterations):
+        start = time.perf_counter()
+        try:
+            await operation(i)
+        except (TimeoutError, ValueError):
+            errors += 1
+            continue
+        samples.append(time.perf_counter() - start)
+    calls = client.calls - before
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "latency_ms": percentiles(samples),
+        "gatt_calls_per_op": {
+            name: round(calls[name] / iterations, 3) for name in GATT_CALLS
+        },
+    }
+
+
+def timeout_warnings(results: dict[str, Any], timeout: float) -> list[str]:
+    """Return a warning for each operation whose p50 is close to the timeout."""
+    warnings = []
+    for name, result in results.items():
+        p50 = result.get("latency_ms", {}).get("p50")
+        if p50 is not None and p50 >= timeout * 1000 * TIMEOUT_WARN_RATIO:
+            warnings.append(
+                f"{name}: p50 {p50:.0f} ms is close to the {timeout:g} s timeout; "
+                "it is probably waiting for a response that never arrives"
+            )
+    return warnings
+
+
+def measure_parsers(iterations: int) -> dict[str, Any]:
+    """Time the packet parsers on simulated notifications.
+
+    Each parser runs on the buffer types backends deliver: bytes, bytearray
+    and a memoryview over a bytearray.
+    """
+    device = SimulatedDevice()
+    parsers = {
+        "parse_status": (parse_status, device.device_state_packet()),
+        "parse_sensors": (parse_sensors, device.probe_sensors_packet()),
+        "parse_schedule_data": (parse_schedule_data, device.schedule_packet()),
+    }
+    results: dict[str, Any] = {}
+    for name, (parser, packet) in parsers.items():
+        buffers = {
+            "bytes": packet,
+            "bytearray": bytearray(packet),
+            "memoryview": memoryview(bytearray(packet)),
+        }
+        results[name] = {
+            kind: round(
+                timeit.timeit(lambda: parser(buffer), number=iterations)
+                / iterations
+                * 1e9,
+                1,
+            )
+            for kind, buffer in buffers.items()
+        }
+    return {"iterations": iterations, "ns_per_packet": results}
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all benchmarks with the transport settings from the command line."""
+    client = SimulatedBleakClient(
+        latency=args.latency,
+        jitter=args.jitter,
+        write_latency=args.write_latency,
+        loss=args.loss,
+        proxy=args.proxy,
+        seed=args.seed,
+    )
+    await client.connect()
+    strategy = FetchStrategy.SEQUENTIAL if args.proxy else FetchStrategy.PIPELINED
+    visionair = VisionAirClient(
+        client, fetch_strategy=strategy, retries=args.retries, status_max_age=0
+    )
+    if args.keep_alive:
+        await visionair.start_notifications()
+
+    schedule = await visionair.get_schedule(timeout=args.timeout)
+
+    operations: dict[str, Callable[[int], Awaitable[Any]]] = {
+        "get_status": lambda i: visionair.get_status(timeout=args.timeout),
+        "get_fresh_status": lambda i: visionair.get_fresh_status(timeout=args.timeout),
+        "set_airflow": lambda i: visionair.set_airflow_mode(
+            AIRFLOW_MODES[i % 3], timeout=args.timeout, force=True
+        ),
+        "get_schedule": lambda i: visionair.get_schedule(timeout=args.timeout),
+        "set_schedule": lambda i: visionair.set_schedule(schedule, timeout=args.timeout),
+    }
+
+    results: dict[str, Any] = {}
+    for name, operation in operations.items():
+        results[name] = await measure(client, operation, args.iterations)
+
+    # Command burst: back-to-back commands as an automation would send them
+    before = Counter(client.calls)
+    start = time.perf_counter()
+    for i in range(args.burst):
+        await visionair.set_airflow_mode(
+            AIRFLOW_MODES[i % 3], timeout=args.timeout, force=True
+        )
+    elapsed = time.perf_counter() - start
+    calls = client.calls - before
+    results["command_burst"] = {
+        "commands": args.burst,
+        "seconds": round(elapsed, 3),
+        "commands_per_second": round(args.burst / elapsed, 3),
+        "gatt_calls": {name: calls[name] for name in GATT_CALLS},
+    }
+
+    if args.keep_alive:
+        await visionair.stop_notifications()
+    await client.disconnect()
+
+    return {
+        "transport": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "write_latency": args.write_latency,
+            "loss": args.loss,
+            "proxy": args.proxy,
+            "fetch_strategy": strategy,
+            "keep_alive": args.keep_alive,
+            "retries": args.retries,
+        },
+        "python": sys.version.split()[0],
+        "results": results,
+        "warnings": timeout_warnings(results, args.timeout),
+        "parsers": measure_parsers(args.parse_iterations),
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and write JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50, help="Runs per operation")
+    parser.add_argument("--burst", type=int, default=20, help="Commands in the throughput burst")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds to first notification")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra seconds per notification")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="Seconds per GATT write")
+    parser.add_argument("--loss", type=float, default=0.0, help="Notification loss probability")
+    parser.add_argument("--proxy", action="store_true", help="Forward only the first notification per write")
+    parser.add_argument("--keep-alive", action="store_true", help="Keep notifications subscribed between operations")
+    parser.add_argument("--retries", type=int, default=0, help="Client resends on timeout")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Seconds to wait per response")
+    parser.add_argument("--parse-iterations", type=int, default=100000, help="Runs per parser benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for jitter and loss")
+    parser.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    for warning in report["warnings"]:
+        print(f"warning: {warning}", file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
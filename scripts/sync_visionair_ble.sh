@@ -10,6 +10,10 @@
 #   5. Commit changes in homeassistant-visionair
 #
 # Set LIB_REPO to override the default source path (../visionair-ble).
+#
+# The sync replaces the vendored copy. If it was edited here since the last
+# sync (its checksum no longer matches .sync_info), the script stops so the
+# edits can be landed in visionair-ble first. Set FORCE=1 to overwrite them.
 
 set -e
 
@@ -19,6 +23,11 @@ LIB_REPO="${LIB_REPO:-$REPO_ROOT/../visionair-ble}"
 LIB_DIR="$LIB_REPO/src/visionair_ble"
 HA_DIR="$REPO_ROOT/custom_components/visionair/visionair_ble"
 
+# Checksum of the library files in a directory
+tree_checksum() {
+    (cd "$1" && find . -type f \( -name '*.py' -o -name py.typed \) | LC_ALL=C sort | xargs sha256sum | sha256sum | cut -d' ' -f1)
+}
+
 if [[ ! -d "$LIB_DIR" ]]; then
     echo "Error: Library not found at $LIB_DIR"
     echo "Set LIB_REPO env var to point to visionair-ble repo"
@@ -41,6 +50,20 @@ if ! (cd "$LIB_REPO" && git diff --quiet && git diff --cached --quiet); then
     fi
 fi
 
+# Refuse to drop changes made to the vendored copy since the last sync
+SYNCED_TREE=""
+if [[ -f "$HA_DIR/.sync_info" ]]; then
+    SYNCED_TREE=$(sed -n 's/^# Tree: //p' "$HA_DIR/.sync_info")
+fi
+if [[ -d "$HA_DIR" && "${FORCE:-}" != "1" ]]; then
+    if [[ -z "$SYNCED_TREE" || "$(tree_checksum "$HA_DIR")" != "$SYNCED_TREE" ]]; then
+        echo "Error: $HA_DIR has changes that are not in visionair-ble"
+        echo "  See: git log -- custom_components/visionair/visionair_ble"
+        echo "  Land them in the library repo first, or set FORCE=1 to overwrite them"
+        exit 1
+    fi
+fi
+
 LIB_COMMIT=$(cd "$LIB_REPO" && git rev-parse --short HEAD)
 LIB_BRANCH=$(cd "$LIB_REPO" && git rev-parse --abbrev-ref HEAD)
 
@@ -57,6 +80,7 @@ cp "$LIB_DIR"/py.typed "$HA_DIR/" 2>/dev/null || true
 cat > "$HA_DIR/.sync_info" << EOF
 # Synced from visionair-ble @ $LIB_COMMIT$LIB_DIRTY ($LIB_BRANCH)
 # Date: $(date -Iseconds)
+# Tree: $(tree_checksum "$HA_DIR")
 EOF
 
 echo ""
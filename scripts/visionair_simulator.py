@@ -0,0 +1,365 @@
+"""In-process VisionAir device simulator.
+
+Provides a stand-in for the parts of BleakClient that VisionAirClient uses,
+backed by a simulated device that answers requests with the same packet
+formats as the real hardware. Useful for exercising the client and for
+measuring request flows without hardware.
+
+The transport can add latency, jitter and packet loss, and can behave like
+an ESPHome proxy that only forwards the first notification per write.
+
+Development tooling only: it lives next to the scripts rather than in the
+integration package, and expects custom_components/visionair on sys.path
+(as benchmark_client.py sets up).
+
+Example:
+    from visionair_ble import FetchStrategy, VisionAirClient
+    from visionair_simulator import SimulatedBleakClient
+
+    client = SimulatedBleakClient(latency=0.05, jitter=0.02, proxy=True)
+    await client.connect()
+    visionair = VisionAirClient(client, fetch_strategy=FetchStrategy.SEQUENTIAL)
+    status = await visionair.get_fresh_status()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+from bleak.exc import BleakError
+
+from visionair_ble.protocol import (
+    COMMAND_CHAR_UUID,
+    CMD_HANDLE,
+    MAGIC,
+    NOTIFY_HANDLE,
+    STATUS_CHAR_UUID,
+    AirflowIndicator,
+    AirflowLevel,
+    DeviceStateOffset,
+    PacketType,
+    ProbeSensorOffset,
+    RequestParam,
+    ScheduleDataOffset,
+    SCHEDULE_MODE_BYTES,
+    verify_checksum,
+)
+
+# Size of the DEVICE_STATE, SCHEDULE, PROBE_SENSORS and SCHEDULE_CONFIG packets
+RESPONSE_SIZE = 182
+
+_INDICATORS = {
+    AirflowLevel.LOW: AirflowIndicator.LOW,
+    AirflowLevel.MEDIUM: AirflowIndicator.MEDIUM,
+    AirflowLevel.HIGH: AirflowIndicator.HIGH,
+}
+
+# REQUEST param 0x18 value -> AirflowLevel
+_MODE_VALUES = {
+    0: AirflowLevel.LOW,
+    1: AirflowLevel.MEDIUM,
+    2: AirflowLevel.HIGH,
+}
+
+
+def _default_schedule() -> bytearray:
+    """24 slots at 16°C, MEDIUM airflow."""
+    return bytearray([16, SCHEDULE_MODE_BYTES[AirflowLevel.MEDIUM]] * 24)
+
+
+@dataclass
+class SimulatedDevice:
+    """State of a simulated VisionAir unit.
+
+    Requests change the state the way the real device does, and the
+    response packets are built from it.
+    """
+
+    device_id: int = 0x123456
+    configured_volume: int = 363
+    operating_days: int = 1200
+    filter_days: int = 300
+    airflow_level: int = AirflowLevel.MEDIUM
+    boost_active: bool = False
+    holiday_days: int = 0
+    preheat_enabled: bool = False
+    preheat_temp: int = 16
+    summer_limit_enabled: bool = False
+    summer_limit_temp: int = 26
+    schedule_enabled: bool = False
+    temp_remote: int = 21
+    humidity_remote: int = 55
+    temp_probe1: int = 18
+    humidity_probe1: int = 60
+    temp_probe2: int = 12
+    filter_percent: int = 80
+    schedule: bytearray = field(default_factory=_default_schedule)
+
+    def handle(self, packet: bytes) -> list[bytes]:
+        """Apply a packet written by the client.
+
+        Args:
+            packet: Complete packet as written to the command characteristic
+
+        Returns:
+            Notifications the device sends in response, in order
+        """
+        if len(packet) < 4 or not verify_checksum(packet):
+            return []
+
+        packet_type = packet[2]
+        if packet_type == PacketType.REQUEST and len(packet) >= 10:
+            return self._handle_request(packet[5], packet[9])
+        if packet_type == PacketType.SYNC and len(packet) >= 8:
+            self.summer_limit_enabled = packet[7] == 0x02
+            return [self.ack_packet()]
+        if packet_type == PacketType.SCHEDULE_WRITE and len(packet) >= 55:
+            self.schedule[:] = packet[6:54]
+            return [self.ack_packet()]
+        return []
+
+    def _handle_request(self, param: int, value: int) -> list[bytes]:
+        """Answer a REQUEST (0x10) packet."""
+        if param == RequestParam.FULL_DATA:
+            return [
+                self.ack_packet(),
+                self.device_state_packet(),
+                self.schedule_packet(),
+                self.probe_sensors_packet(),
+            ]
+        if param == RequestParam.PROBE_SENSORS:
+            return [self.probe_sensors_packet()]
+        if param == RequestParam.SCHEDULE_CONFIG:
+            return [self.schedule_config_packet()]
+
+        if param == RequestParam.MODE_SELECT:
+            if value not in _MODE_VALUES:
+                return []
+            self.airflow_level = _MODE_VALUES[value]
+        elif param == RequestParam.BOOST:
+            self.boost_active = bool(value)
+        elif param == RequestParam.HOLIDAY:
+            self.holiday_days = value
+        elif param == RequestParam.PREHEAT:
+            self.preheat_enabled = bool(value)
+        elif param == RequestParam.PREHEAT_TEMP:
+            self.preheat_temp = value
+        elif param == RequestParam.SUMMER_LIMIT_TEMP:
+            self.summer_limit_temp = value
+        elif param == RequestParam.SCHEDULE_TOGGLE:
+            self.schedule_enabled = bool(value)
+        elif param != RequestParam.DEVICE_STATE:
+            return []
+        return [self.device_state_packet()]
+
+    def device_state_packet(self) -> bytes:
+        """Build a DEVICE_STATE (0x01) packet."""
+        data = self._response(PacketType.DEVICE_STATE)
+        o = DeviceStateOffset
+        data[o.UNKNOWN_5_7:o.UNKNOWN_5_7 + 3] = self.device_id.to_bytes(3, "little")
+        data[o.CONFIGURED_VOLUME:o.CONFIGURED_VOLUME + 2] = self.configured_volume.to_bytes(2, "little")
+        data[o.OPERATING_DAYS:o.OPERATING_DAYS + 2] = self.operating_days.to_bytes(2, "little")
+        data[o.FILTER_DAYS:o.FILTER_DAYS + 2] = self.filter_days.to_bytes(2, "little")
+        data[o.MODE_SELECTOR] = self.airflow_level - 1
+        data[o.SUMMER_LIMIT_TEMP] = self.summer_limit_temp
+        data[o.HOLIDAY_DAYS] = self.holiday_days
+        data[o.BOOST_ACTIVE] = 1 if self.boost_active else 0
+        data[o.AIRFLOW_INDICATOR] = _INDICATORS[self.airflow_level]
+        data[o.SUMMER_LIMIT_ENABLED] = 1 if self.summer_limit_enabled else 0
+        data[o.PREHEAT_ENABLED] = 1 if self.preheat_enabled else 0
+        data[o.PREHEAT_TEMP] = self.preheat_temp
+        return bytes(data)
+
+    def schedule_packet(self) -> bytes:
+        """Build a SCHEDULE (0x02) packet with the Remote readings."""
+        data = self._response(PacketType.SCHEDULE)
+        data[ScheduleDataOffset.REMOTE_TEMP] = self.temp_remote
+        data[ScheduleDataOffset.REMOTE_HUMIDITY] = self.humidity_remote
+        return bytes(data)
+
+    def probe_sensors_packet(self) -> bytes:
+        """Build a PROBE_SENSORS (0x03) packet."""
+        data = self._response(PacketType.PROBE_SENSORS)
+        data[ProbeSensorOffset.TEMP_PROBE1] = self.temp_probe1
+        data[ProbeSensorOffset.HUMIDITY_PROBE1] = self.humidity_probe1
+        data[ProbeSensorOffset.TEMP_PROBE2] = self.temp_probe2
+        data[ProbeSensorOffset.FILTER_PERCENT] = self.filter_percent
+        return bytes(data)
+
+    def schedule_config_packet(self) -> bytes:
+        """Build a SCHEDULE_CONFIG (0x46) packet with the 24 slots."""
+        data = self._response(PacketType.SCHEDULE_CONFIG)
+        data[3:6] = bytes([0x06, 0x31, 0x00])
+        data[6:54] = self.schedule
+        return bytes(data)
+
+    @staticmethod
+    def ack_packet() -> bytes:
+        """Build an ACK (0x23) packet."""
+        return MAGIC + bytes([PacketType.ACK, 0x00, 0x00])
+
+    @staticmethod
+    def _response(packet_type: int) -> bytearray:
+        data = bytearray(RESPONSE_SIZE)
+        data[0:2] = MAGIC
+        data[2] = packet_type
+        return data
+
+
+@dataclass
+class SimulatedCharacteristic:
+    """GATT characteristic with the attributes the client reads."""
+
+    uuid: str
+    handle: int
+
+
+@dataclass
+class SimulatedService:
+    """GATT service holding the VisionAir characteristics."""
+
+    characteristics: list[SimulatedCharacteristic]
+
+
+class SimulatedServices:
+    """Minimal BleakGATTServiceCollection."""
+
+    def __init__(self) -> None:
+        """Initialize with the status and command characteristics."""
+        self.status = SimulatedCharacteristic(STATUS_CHAR_UUID, NOTIFY_HANDLE)
+        self.command = SimulatedCharacteristic(COMMAND_CHAR_UUID, CMD_HANDLE)
+        self._services = [SimulatedService([self.status, self.command])]
+
+    def __iter__(self) -> Iterator[SimulatedService]:
+        return iter(self._services)
+
+    def get_characteristic(
+        self, specifier: int | str | SimulatedCharacteristic
+    ) -> SimulatedCharacteristic | None:
+        """Look up a characteristic by handle or UUID."""
+        for char in (self.status, self.command):
+            if specifier in (char, char.handle, char.uuid):
+                return char
+        return None
+
+
+class SimulatedBleakClient:
+    """BleakClient stand-in talking to a SimulatedDevice.
+
+    Every GATT call is counted in ``calls`` (``connect``, ``write``,
+    ``start_notify``, ``stop_notify``, plus ``notify`` for delivered and
+    ``dropped`` for lost notifications).
+
+    Args:
+        device: Simulated device (default: a new SimulatedDevice)
+        address: Address reported to the client
+        latency: Seconds from a write to its first notification
+        jitter: Extra random delay per notification, up to this many seconds
+        interval: Seconds between notifications of one response
+        write_latency: Seconds each write with response takes
+        loss: Probability that a notification is lost
+        proxy: Forward only the first notification per write, like the
+            ESPHome Bluetooth proxy
+        seed: Seed for the jitter and loss random generator
+    """
+
+    def __init__(
+        self,
+        device: SimulatedDevice | None = None,
+        *,
+        address: str = "00:A0:50:00:00:01",
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        interval: float = 0.01,
+        write_latency: float = 0.0,
+        loss: float = 0.0,
+        proxy: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the simulated client."""
+        self.device = device or SimulatedDevice()
+        self.address = address
+        self.latency = latency
+        self.jitter = jitter
+        self.interval = interval
+        self.write_latency = write_latency
+        self.loss = loss
+        self.proxy = proxy
+        self.services = SimulatedServices()
+        self.calls: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._callback: Callable[..., None] | None = None
+        self._connected = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the simulated link is up."""
+        return self._connected
+
+    async def connect(self, **kwargs: object) -> bool:
+        """Open the simulated link."""
+        self.calls["connect"] += 1
+        self._connected = True
+        return True
+
+    async def disconnect(self) -> bool:
+        """Close the link and drop notifications still in flight."""
+        self.calls["disconnect"] += 1
+        self._connected = False
+        self._callback = None
+        for task in self._tasks:
+            task.cancel()
+        return True
+
+    async def start_notify(
+        self, char_specifier: object, callback: Callable[..., None], **kwargs: object
+    ) -> None:
+        """Subscribe to status notifications."""
+        self._check_connected()
+        self.calls["start_notify"] += 1
+        self._callback = callback
+
+    async def stop_notify(self, char_specifier: object) -> None:
+        """Unsubscribe from status notifications."""
+        self._check_connected()
+        self.calls["stop_notify"] += 1
+        self._callback = None
+
+    async def write_gatt_char(
+        self, char_specifier: object, data: bytes | bytearray, response: bool = False
+    ) -> None:
+        """Write a packet to the device and schedule its notifications."""
+        self._check_connected()
+        self.calls["write"] += 1
+        if response and self.write_latency:
+            await asyncio.sleep(self.write_latency)
+
+        packets = self.device.handle(bytes(data))
+        if self.proxy:
+            packets = packets[:1]
+        if packets:
+            task = asyncio.get_running_loop().create_task(self._notify(packets))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _notify(self, packets: list[bytes]) -> None:
+        """Deliver notifications with the configured delays and loss."""
+        delay = self.latency
+        for packet in packets:
+            await asyncio.sleep(delay + self._random.uniform(0, self.jitter))
+            delay = self.interval
+            if self.loss and self._random.random() < self.loss:
+                self.calls["dropped"] += 1
+                continue
+            if self._callback is not None:
+                self.calls["notify"] += 1
+                self._callback(self.services.status, bytearray(packet))
+
+    def _check_connected(self) -> None:
+        if not self._connected:
+            raise BleakError("Simulated device is not connected")
@@ -0,0 +1,12 @@
+"""Shared test setup.
+
+Makes the integration importable as custom_components.visionair and the
+vendored library as visionair_ble, the same way scripts/ import it.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "custom_components" / "visionair"))
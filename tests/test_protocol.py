@@ -0,0 +1,193 @@
+"""Tests for packet building and parsing.
+
+The expected bytes and values were produced by the builders and parsers
+before they were cached and moved to struct layouts, so these pin the
+wire format against regressions.
+"""
+
+import pytest
+
+from visionair_ble.protocol import (
+    AirflowLevel,
+    PacketType,
+    ScheduleConfig,
+    ScheduleSlot,
+    build_boost_command,
+    build_full_data_request,
+    build_holiday_command,
+    build_mode_select_request,
+    build_preheat_request,
+    build_preheat_temp_request,
+    build_request,
+    build_schedule_config_request,
+    build_schedule_write,
+    build_sensor_request,
+    build_status_request,
+    build_sync_packet,
+    parse_schedule_config,
+    parse_schedule_data,
+    parse_sensors,
+    parse_status,
+    verify_checksum,
+)
+
+
+def _packet(packet_type: int, values: dict[int, int], size: int = 182) -> bytes:
+    """Return a packet of packet_type with the given byte values set."""
+    data = bytearray(size)
+    data[0:3] = bytes([0xA5, 0xB6, packet_type])
+    for offset, value in values.items():
+        data[offset] = value
+    return bytes(data)
+
+
+DEVICE_STATE = _packet(
+    PacketType.DEVICE_STATE,
+    {
+        5: 0x12, 6: 0x34, 7: 0x56,  # device ID
+        22: 0x2C, 23: 0x01,  # configured volume 300 m³
+        26: 0xF4, 27: 0x01,  # operating days 500
+        28: 0xC8,  # filter days 200
+        34: 1,  # mode selector
+        38: 26,  # summer limit temperature
+        47: 0xC2,  # airflow indicator
+        56: 16,  # preheat temperature
+    },
+)
+SCHEDULE = _packet(PacketType.SCHEDULE, {11: 21, 13: 55})
+PROBE_SENSORS = _packet(PacketType.PROBE_SENSORS, {6: 18, 8: 60, 11: 12, 13: 80})
+SCHEDULE_CONFIG = _packet(
+    PacketType.SCHEDULE_CONFIG,
+    {3: 6, 4: 0x31, **{6 + i: 16 if i % 2 == 0 else 0x32 for i in range(48)}},
+)
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ((0x03,), "a5b6100005030000000016"),
+        ((0x06,), "a5b6100005060000000013"),
+        ((0x07,), "a5b6100005070000000012"),
+        ((0x18, 2), "a5b610000518000000000d"),
+        ((0x1C, 15), "a5b61000051c0000000009"),
+        ((0x1A, 7, True), "a5b61006051a000000070e"),
+        ((0xFF, 0xFF, True), "a5b6100605ff000000ff13"),
+    ],
+)
+def test_build_request(args: tuple, expected: str) -> None:
+    """build_request produces the same bytes as before."""
+    assert build_request(*args).hex() == expected
+
+
+def test_build_request_checksums() -> None:
+    """Every request carries a valid checksum."""
+    for param in range(256):
+        for value in range(256):
+            assert verify_checksum(build_request(param, value, True))
+
+
+@pytest.mark.parametrize(
+    ("packet", "expected"),
+    [
+        (build_status_request(), "a5b6100005030000000016"),
+        (build_sensor_request(), "a5b6100605070000000014"),
+        (build_full_data_request(), "a5b6100605060000000015"),
+        (build_schedule_config_request(), "a5b6100605270000000034"),
+        (build_mode_select_request(AirflowLevel.HIGH), "a5b6100605180000000209"),
+        (build_boost_command(True), "a5b610060519000000010b"),
+        (build_boost_command(False), "a5b610060519000000000a"),
+        (build_preheat_request(True), "a5b61006052f000000013d"),
+        (build_preheat_temp_request(16), "a5b61006051c000000101f"),
+        (build_holiday_command(7), "a5b61006051a000000070e"),
+    ],
+)
+def test_command_builders(packet: bytes, expected: str) -> None:
+    """The command builders produce the same bytes as before."""
+    assert packet.hex() == expected
+
+
+def test_build_sync_packet() -> None:
+    """build_sync_packet produces the same bytes as before."""
+    assert build_sync_packet(True, 26, AirflowLevel.MEDIUM).hex() == "a5b61a06061a02021a281527"
+    assert build_sync_packet(False, 0, AirflowLevel.LOW).hex() == "a5b61a06061a020000190a11"
+
+
+def test_build_sync_packet_invalid_airflow() -> None:
+    """An unknown airflow level is rejected."""
+    with pytest.raises(ValueError):
+        build_sync_packet(False, 16, 4)
+
+
+def test_parse_status() -> None:
+    """parse_status decodes the same fields as before."""
+    status = parse_status(DEVICE_STATE)
+
+    assert status is not None
+    assert status.device_id == 0x563412
+    assert status.airflow_indicator == 0xC2
+    assert status.mode_selector == 1
+    assert status.mode_name == "Medium"
+    assert status.airflow == 135
+    assert status.airflow_mode == "medium"
+    assert status.configured_volume == 300
+    assert (status.airflow_low, status.airflow_medium, status.airflow_high) == (108, 135, 165)
+    assert status.filter_days == 200
+    assert status.operating_days == 500
+    assert status.preheat_enabled is False
+    assert status.preheat_temp == 16
+    assert status.summer_limit_enabled is False
+    assert status.summer_limit_temp == 26
+    assert status.boost_active is False
+    assert status.holiday_days == 0
+    assert status.temp_remote is None
+    assert status.temp_probe1 is None
+
+
+def test_parse_sensors() -> None:
+    """parse_sensors decodes the probe readings as before."""
+    sensors = parse_sensors(PROBE_SENSORS)
+
+    assert sensors is not None
+    assert sensors.temp_probe1 == 18
+    assert sensors.temp_probe2 == 12
+    assert sensors.humidity_probe1 == 60
+    assert sensors.filter_percent == 80
+
+
+def test_parse_schedule_data() -> None:
+    """parse_schedule_data decodes the remote readings as before."""
+    assert parse_schedule_data(SCHEDULE) == (21, 55)
+
+
+def test_parsers_reject_other_packets() -> None:
+    """Each parser returns nothing for another packet type or a short packet."""
+    assert parse_status(bytes([0xA5, 0xB6, PacketType.DEVICE_STATE])) is None
+    assert parse_status(SCHEDULE) is None
+    assert parse_sensors(SCHEDULE) is None
+    assert parse_schedule_data(PROBE_SENSORS) == (None, None)
+
+
+def test_schedule_config_round_trip() -> None:
+    """A parsed schedule is written back with the same bytes as before."""
+    config = parse_schedule_config(SCHEDULE_CONFIG)
+
+    assert config is not None
+    assert list(config.slots) == [ScheduleSlot(preheat_temp=16, mode_byte=0x32)] * 24
+    assert build_schedule_write(config).hex() == (
+        "a5b640063100" + "1032" * 24 + "77"
+    )
+
+
+def test_build_schedule_write() -> None:
+    """build_schedule_write produces the same bytes as before."""
+    config = ScheduleConfig(
+        slots=[
+            ScheduleSlot(preheat_temp=14 + hour % 4, mode_byte=0x31 + hour % 3)
+            for hour in range(24)
+        ]
+    )
+
+    assert build_schedule_write(config).hex() == (
+        "a5b6400631000e310f32103311310e320f33103111320e33"
+        "0f31103211330e310f32103311310e320f33103111320e330f311032113377"
+    )
@@ -0,0 +1,84 @@
+"""Tests for the sensor platform."""
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.visionair import sensor  # noqa: E402
+from custom_components.visionair.const import DOMAIN  # noqa: E402
+from custom_components.visionair.visionair_ble import DeviceStatus  # noqa: E402
+
+STRINGS = Path(__file__).resolve().parent.parent / "custom_components" / "visionair" / "strings.json"
+
+ADDRESS = "00:11:22:33:44:55"
+
+STATUS = DeviceStatus(
+    device_id=1,
+    airflow_indicator=38,
+    mode_selector=0,
+    mode_name="MEDIUM",
+    airflow=131,
+    temp_remote=20,
+    temp_probe1=18,
+    temp_probe2=5,
+    humidity_remote=50.0,
+    humidity_probe1=60,
+)
+
+
+def _setup_entities() -> list:
+    """Run the platform setup against a mocked coordinator."""
+    coordinator = MagicMock(data=STATUS, changed_fields=None)
+    coordinator.air_volume.total = 0.0
+    entry = SimpleNamespace(entry_id="entry", title="VisionAir", data={"address": ADDRESS})
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: coordinator}})
+    entities: list = []
+    asyncio.run(sensor.async_setup_entry(hass, entry, entities.extend))
+    return entities
+
+
+def test_setup_entry_adds_every_sensor() -> None:
+    """Every description and diagnostic sensor gets one uniquely-IDed entity."""
+    entities = _setup_entities()
+    unique_ids = [entity.unique_id for entity in entities]
+
+    assert len(unique_ids) == len(set(unique_ids))
+    for description in sensor.SENSOR_DESCRIPTIONS + sensor.DERIVED_SENSOR_DESCRIPTIONS:
+        assert f"{ADDRESS}_{description.key}" in unique_ids
+    for key in ("air_volume", "rssi", "last_seen", "last_poll_duration", "poll_success_rate"):
+        assert f"{ADDRESS}_{key}" in unique_ids
+
+
+def test_sensors_have_translations() -> None:
+    """Each sensor's translation key has a name in strings.json."""
+    names = json.loads(STRINGS.read_text())["entity"]["sensor"]
+
+    for entity in _setup_entities():
+        assert entity.translation_key in names
+
+
+def test_derived_sensor_values() -> None:
+    """Derived sensors compute their values from the coordinator data."""
+    values = {
+        entity.unique_id.removeprefix(f"{ADDRESS}_"): entity.native_value
+        for entity in _setup_entities()
+        if isinstance(entity, sensor.VisionAirSensor)
+    }
+
+    assert values["heat_recovery_efficiency"] == pytest.approx(86.7, abs=0.1)
+    assert values["thermal_power"] == pytest.approx(570.5, abs=0.1)
+    assert values["absolute_humidity_remote"] == pytest.approx(8.6, abs=0.1)
+
+
+def test_absolute_humidity_unit() -> None:
+    """Absolute humidity uses a plain unit string, not a newer HA constant."""
+    by_key = {desc.key: desc for desc in sensor.DERIVED_SENSOR_DESCRIPTIONS}
+
+    assert by_key["absolute_humidity_remote"].native_unit_of_measurement == "g/m³"
+    assert by_key["absolute_humidity_probe1"].native_unit_of_measurement == "g/m³"